@@ -2,25 +2,101 @@
 Advanced group chat example with specialized agents and memory persistence.
 """
 
+import io
 import os
 import sys
-import uuid
-import dotenv
-from pathlib import Path
+import json
+import functools
+import asyncio
 # We'll use direct agent conversations instead of autogen's GroupChat
 
 # Add the parent directory to the Python path
-sys.path.append(str(Path(__file__).parent.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.bootstrap import load_env_once
 
 # Load environment variables from .env file
-dotenv.load_dotenv()
+load_env_once()
+
+# Settings the framework needs to reach Azure OpenAI
+REQUIRED_ENV_VARS = ("AZURE_OPENAI_API_KEY", "AZURE_OPENAI_ENDPOINT", "AZURE_OPENAI_DEPLOYMENT_NAME")
+
+# Domain knowledge for specialized agents
+RESEARCH_KNOWLEDGE = {
+    "instructions": "You are a research specialist. Focus on finding and analyzing information.",
+    "guidelines": [
+        "Always cite your sources",
+        "Consider multiple perspectives",
+        "Distinguish between facts and opinions",
+        "Identify gaps in available information"
+    ],
+    "examples": [
+        "When asked about climate change, I should provide data from peer-reviewed studies.",
+        "When analyzing market trends, I should consider economic indicators from multiple sources."
+    ]
+}
+
+CODING_KNOWLEDGE = {
+    "instructions": "You are a coding specialist. Focus on writing clean, efficient, and well-documented code.",
+    "guidelines": [
+        "Follow language-specific best practices",
+        "Write code that is easy to understand and maintain",
+        "Include comments for complex logic",
+        "Consider edge cases and error handling"
+    ],
+    "examples": [
+        "When writing Python code, I should follow PEP 8 style guidelines.",
+        "When implementing algorithms, I should analyze time and space complexity."
+    ]
+}
+
+PLANNING_KNOWLEDGE = {
+    "instructions": "You are a planning specialist. Focus on organizing tasks and creating actionable plans.",
+    "guidelines": [
+        "Break down complex problems into manageable steps",
+        "Prioritize tasks based on importance and dependencies",
+        "Set realistic timelines",
+        "Identify potential risks and mitigation strategies"
+    ],
+    "examples": [
+        "When planning a software project, I should create a roadmap with milestones.",
+        "When organizing tasks, I should consider resource constraints and dependencies."
+    ]
+}
 
-from src.framework import AgentFramework
-from src.utils.memory_manager import MemoryManager
+# Serialize the domain knowledge once, compactly and deterministically, for the system messages
+RESEARCH_KB_JSON = json.dumps(RESEARCH_KNOWLEDGE, separators=(",", ":"), sort_keys=True)
+CODING_KB_JSON = json.dumps(CODING_KNOWLEDGE, separators=(",", ":"), sort_keys=True)
+PLANNING_KB_JSON = json.dumps(PLANNING_KNOWLEDGE, separators=(",", ":"), sort_keys=True)
+
+def memory_dump_lines(agent_name, memories):
+    """
+    Yield the printable lines for an agent's memories.
+    
+    Args:
+        agent_name: Name of the agent
+        memories: Memories as returned by MemoryManager.retrieve_memories
+    """
+    yield f"\n{agent_name}'s Memories:"
+    for memory in memories:
+        yield f"- Type: {memory['memory_type']}"
+        if isinstance(memory['content'], dict):
+            yield from (f"  {key}: {value}" for key, value in memory['content'].items())
+        else:
+            yield f"  Content: {memory['content']}"
 
 def main():
     """Run the advanced group chat example with memory persistence."""
     
+    # Check required settings before paying for the framework imports
+    missing = [name for name in REQUIRED_ENV_VARS if not os.getenv(name)]
+    if missing:
+        print(f"Missing required environment variables: {', '.join(missing)}")
+        sys.exit(1)
+    
+    from src.framework import AgentFramework
+    from src.utils.memory_manager import MemoryManager, new_conversation_id
+    
     # Create a new agent framework
     framework = AgentFramework()
     
@@ -28,81 +104,21 @@ def main():
     memory_manager = MemoryManager(db_path="group_chat_memories.db")
     
     # Generate a unique conversation ID
-    conversation_id = str(uuid.uuid4())
+    conversation_id = new_conversation_id()
     memory_manager.create_conversation(conversation_id, "Advanced Group Chat")
     
-    # Define domain knowledge for specialized agents
-    research_knowledge = {
-        "instructions": "You are a research specialist. Focus on finding and analyzing information.",
-        "guidelines": [
-            "Always cite your sources",
-            "Consider multiple perspectives",
-            "Distinguish between facts and opinions",
-            "Identify gaps in available information"
-        ],
-        "examples": [
-            "When asked about climate change, I should provide data from peer-reviewed studies.",
-            "When analyzing market trends, I should consider economic indicators from multiple sources."
-        ]
-    }
-    
-    coding_knowledge = {
-        "instructions": "You are a coding specialist. Focus on writing clean, efficient, and well-documented code.",
-        "guidelines": [
-            "Follow language-specific best practices",
-            "Write code that is easy to understand and maintain",
-            "Include comments for complex logic",
-            "Consider edge cases and error handling"
-        ],
-        "examples": [
-            "When writing Python code, I should follow PEP 8 style guidelines.",
-            "When implementing algorithms, I should analyze time and space complexity."
-        ]
-    }
-    
-    planning_knowledge = {
-        "instructions": "You are a planning specialist. Focus on organizing tasks and creating actionable plans.",
-        "guidelines": [
-            "Break down complex problems into manageable steps",
-            "Prioritize tasks based on importance and dependencies",
-            "Set realistic timelines",
-            "Identify potential risks and mitigation strategies"
-        ],
-        "examples": [
-            "When planning a software project, I should create a roadmap with milestones.",
-            "When organizing tasks, I should consider resource constraints and dependencies."
-        ]
-    }
-    
-    # Define a function to log messages to the memory manager
-    def log_message_to_memory(sender_name, receiver_name, content):
-        """Log a message to the memory manager."""
-        memory_manager.add_message(conversation_id, sender_name, receiver_name, content)
-        return True
-    
-    # Define a function to retrieve agent memories
-    def get_agent_memories(agent_name, memory_type=None):
-        """Retrieve memories for an agent."""
-        memories = memory_manager.retrieve_memories(agent_name, memory_type)
-        return memories
-    
-    # Define a function to store agent memories
-    def store_agent_memory(agent_name, memory_type, content):
-        """Store a memory for an agent."""
-        success = memory_manager.store_memory(agent_name, memory_type, content)
-        return success
-    
-    # Register memory-related tools
+    # Register memory-related tools, bound directly to the memory manager.
+    # Logged messages always go to this example's conversation.
     framework.register_tool(
         name="log_message",
         description="Log a message to the conversation history",
-        function=log_message_to_memory,
+        function=functools.partial(memory_manager.add_message, conversation_id),
         parameters={
-            "sender_name": {
+            "sender": {
                 "type": "string",
                 "description": "Name of the sender"
             },
-            "receiver_name": {
+            "receiver": {
                 "type": "string",
                 "description": "Name of the receiver"
             },
@@ -116,7 +132,7 @@ def main():
     framework.register_tool(
         name="get_memories",
         description="Retrieve memories for an agent",
-        function=get_agent_memories,
+        function=memory_manager.retrieve_memories,
         parameters={
             "agent_name": {
                 "type": "string",
@@ -132,7 +148,7 @@ def main():
     framework.register_tool(
         name="store_memory",
         description="Store a memory for an agent",
-        function=store_agent_memory,
+        function=memory_manager.store_memory,
         parameters={
             "agent_name": {
                 "type": "string",
@@ -151,7 +167,7 @@ def main():
     
     # Create specialized agents
     # Incorporate domain knowledge into system message
-    enhanced_system_message = f"You are a research specialist in a group chat. Your role is to find and analyze information.\n\nDomain Knowledge: {research_knowledge}"
+    enhanced_system_message = f"You are a research specialist in a group chat. Your role is to find and analyze information.\n\nDomain Knowledge: {RESEARCH_KB_JSON}"
     
     researcher = framework.create_agent(
         agent_type="assistant",
@@ -161,7 +177,7 @@ def main():
     )
     
     # Incorporate domain knowledge into system message for coder
-    enhanced_coder_message = f"You are a coding specialist in a group chat. Your role is to write and review code.\n\nDomain Knowledge: {coding_knowledge}"
+    enhanced_coder_message = f"You are a coding specialist in a group chat. Your role is to write and review code.\n\nDomain Knowledge: {CODING_KB_JSON}"
     
     coder = framework.create_agent(
         agent_type="assistant",
@@ -171,7 +187,7 @@ def main():
     )
     
     # Incorporate domain knowledge into system message for planner
-    enhanced_planner_message = f"You are a planning specialist in a group chat. Your role is to organize tasks and create actionable plans.\n\nDomain Knowledge: {planning_knowledge}"
+    enhanced_planner_message = f"You are a planning specialist in a group chat. Your role is to organize tasks and create actionable plans.\n\nDomain Knowledge: {PLANNING_KB_JSON}"
     
     planner = framework.create_agent(
         agent_type="assistant",
@@ -190,36 +206,24 @@ def main():
         code_execution_config={"use_docker": False}
     )
     
-    # Store initial memories for agents
-    memory_manager.store_memory(
-        agent_name="Researcher",
-        memory_type="skill",
-        content={
+    # Store initial memories for agents in one transaction
+    memory_manager.store_memories_bulk([
+        ("Researcher", "skill", {
             "skill_name": "information_gathering",
             "proficiency": "expert",
             "description": "Ability to gather information from various sources and synthesize it"
-        }
-    )
-    
-    memory_manager.store_memory(
-        agent_name="Coder",
-        memory_type="skill",
-        content={
+        }),
+        ("Coder", "skill", {
             "skill_name": "python_programming",
             "proficiency": "expert",
             "description": "Ability to write clean, efficient Python code"
-        }
-    )
-    
-    memory_manager.store_memory(
-        agent_name="Planner",
-        memory_type="skill",
-        content={
+        }),
+        ("Planner", "skill", {
             "skill_name": "task_organization",
             "proficiency": "expert",
             "description": "Ability to break down complex problems into manageable tasks"
-        }
-    )
+        }),
+    ])
     
     # Create a coordinator agent to facilitate the conversation between other agents
     coordinator = framework.create_agent(
@@ -230,12 +234,12 @@ def main():
     )
     
     # Define a function to print conversation history
-    def print_conversation_history():
+    def print_conversation_history(out=sys.stdout):
         """Print the conversation history from the memory manager."""
-        print("\n=== Conversation History ===\n")
-        history = memory_manager.get_conversation_history(conversation_id)
+        print("\n=== Conversation History ===\n", file=out)
+        history = memory_manager.get_conversation_history_summary(conversation_id, content_chars=100)
         for i, message in enumerate(history, 1):
-            print(f"{i}. {message['timestamp']} - {message['sender']} to {message['receiver']}: {message['content'][:100]}...")
+            print(f"{i}. {message['timestamp']} - {message['sender']} to {message['receiver']}: {message['content']}...", file=out)
     
     # Define the initial message
     initial_message = (
@@ -246,7 +250,8 @@ def main():
     # Start the group chat
     print("Starting the advanced group chat with specialized agents and memory persistence...")
     
-    # Log the initial message to memory
+    # Write messages to memory in the background while the agents are talking
+    memory_manager.start_writer()
     memory_manager.add_message(conversation_id, "User", "Coordinator", initial_message)
     
     # Start a conversation sequence instead of using GroupChat
@@ -254,39 +259,59 @@ def main():
     print("\n[User -> Coordinator]")
     user_proxy.initiate_chat(coordinator, message=initial_message)
     
-    # Then coordinator delegates to researcher
-    print("\n[Coordinator -> Researcher]")
+    # Then coordinator delegates to the researcher, planner and coder.
+    # The requests are independent, so run them concurrently.
     research_request = "Please research APIs for stock market data analysis and provide recommendations."
-    coordinator.initiate_chat(researcher, message=research_request)
-    memory_manager.add_message(conversation_id, "Coordinator", "Researcher", research_request)
-    
-    # Then coordinator delegates to planner
-    print("\n[Coordinator -> Planner]")
     planning_request = "Please create a project plan for building a web application that analyzes stock market data."
-    coordinator.initiate_chat(planner, message=planning_request)  
-    memory_manager.add_message(conversation_id, "Coordinator", "Planner", planning_request)
-    
-    # Finally, coordinator delegates to coder
-    print("\n[Coordinator -> Coder]")
     coding_request = "Please provide sample code for parsing and analyzing stock market data."
-    coordinator.initiate_chat(coder, message=coding_request)
+    
+    # Autogen agents aren't thread-safe, so each concurrent chat gets its own coordinator agent
+    delegators = {
+        name: framework.create_agent(
+            agent_type="assistant",
+            name=f"Coordinator{name}",
+            description=f"Coordinator delegating to the {name.lower()}",
+            system_message=coordinator.system_message
+        )
+        for name in ("Researcher", "Planner", "Coder")
+    }
+    
+    async def delegate_to_specialists():
+        """Send the coordinator's requests to all specialists at once."""
+        await asyncio.gather(
+            framework.initiate_chat_async(delegators["Researcher"], researcher, research_request),
+            framework.initiate_chat_async(delegators["Planner"], planner, planning_request),
+            framework.initiate_chat_async(delegators["Coder"], coder, coding_request),
+        )
+    
+    memory_manager.add_message(conversation_id, "Coordinator", "Researcher", research_request)
+    memory_manager.add_message(conversation_id, "Coordinator", "Planner", planning_request)
     memory_manager.add_message(conversation_id, "Coordinator", "Coder", coding_request)
     
+    print("\n[Coordinator -> Researcher, Planner, Coder]")
+    asyncio.run(delegate_to_specialists())
+    
+    # Make sure every queued message is written before reading the history back
+    memory_manager.flush()
+    
+    # Build the end-of-run report in memory and write it to stdout at once
+    report = io.StringIO()
+    
     # Print the conversation history
-    print_conversation_history()
+    print_conversation_history(out=report)
     
     # Print agent memories after the conversation
-    print("\n=== Agent Memories After Conversation ===")
-    for agent_name in ["Researcher", "Coder", "Planner"]:
-        memories = memory_manager.retrieve_memories(agent_name)
-        print(f"\n{agent_name}'s Memories:")
-        for memory in memories:
-            print(f"- Type: {memory['memory_type']}")
-            if isinstance(memory['content'], dict):
-                for key, value in memory['content'].items():
-                    print(f"  {key}: {value}")
-            else:
-                print(f"  Content: {memory['content']}")
+    print("\n=== Agent Memories After Conversation ===", file=report)
+    memories_by_agent = memory_manager.retrieve_memories_multi(["Researcher", "Coder", "Planner"])
+    lines = (
+        line
+        for agent_name, memories in memories_by_agent.items()
+        for line in memory_dump_lines(agent_name, memories)
+    )
+    print("\n".join(lines), file=report)
+    sys.stdout.write(report.getvalue())
+    
+    memory_manager.close()
 
 if __name__ == "__main__":
     main()
@@ -4,45 +4,52 @@ Azure OpenAI integration example using the Autogen Agents Framework.
 
 import os
 import sys
-import dotenv
-from pathlib import Path
 
 # Add the parent directory to the Python path
-sys.path.append(str(Path(__file__).parent.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.bootstrap import load_env_once
 
 # Load environment variables from .env file
-dotenv.load_dotenv()
+load_env_once()
 
-from src.framework import AgentFramework
-from src.config.azure_openai import create_llm_config
-from src.config.config_manager import AzureOpenAIConfig
+# Settings the framework needs to reach Azure OpenAI
+REQUIRED_ENV_VARS = ("AZURE_OPENAI_API_KEY", "AZURE_OPENAI_ENDPOINT", "AZURE_OPENAI_DEPLOYMENT_NAME")
 
 def main():
     """Run the Azure OpenAI integration example."""
     
+    # Check required settings before paying for the framework imports
+    missing = [name for name in REQUIRED_ENV_VARS if not os.getenv(name)]
+    if missing:
+        print(f"Missing required environment variables: {', '.join(missing)}")
+        sys.exit(1)
+    
+    from src.framework import AgentFramework
+    from src.config.azure_openai import create_llm_config
+    
     # Create a new agent framework
     framework = AgentFramework()
     
-    # Create custom Azure OpenAI configurations for different agents
-    azure_config = AzureOpenAIConfig(
-        api_key=os.getenv("AZURE_OPENAI_API_KEY", ""),
-        endpoint=os.getenv("AZURE_OPENAI_ENDPOINT", ""),
-        api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2023-05-15"),
-        deployment_name=os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "")
-    )
+    # Reuse the Azure OpenAI configuration the framework already loaded from the environment
+    azure_config = framework.config_manager.get_azure_openai_config()
     
-    # Create different LLM configs with different parameters
-    creative_llm_config = create_llm_config(
-        config=azure_config,
-        temperature=0.9,  # Higher temperature for more creative responses
-        max_tokens=2000
-    )
+    # Build the base LLM config once
+    base_llm_config = create_llm_config(config=azure_config)
+    base_model_config = base_llm_config["config_list"][0]
     
-    precise_llm_config = create_llm_config(
-        config=azure_config,
-        temperature=0.1,  # Lower temperature for more precise responses
-        max_tokens=1000
-    )
+    # Derive LLM configs with different parameters from the base
+    creative_llm_config = {
+        **base_llm_config,
+        "temperature": 0.9,  # Higher temperature for more creative responses
+        "config_list": [{**base_model_config, "max_tokens": 2000}]
+    }
+    
+    precise_llm_config = {
+        **base_llm_config,
+        "temperature": 0.1,  # Lower temperature for more precise responses
+        "config_list": [{**base_model_config, "max_tokens": 1000}]
+    }
     
     # Create a creative assistant agent
     creative_assistant = framework.create_agent(
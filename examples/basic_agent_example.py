@@ -7,14 +7,14 @@ then initiates a conversation between them.
 import os
 import sys
 import uuid
-import dotenv
-from pathlib import Path
 
 # Add the parent directory to the Python path
-sys.path.append(str(Path(__file__).parent.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.bootstrap import load_env_once
 
 # Load environment variables from .env file
-dotenv.load_dotenv()
+load_env_once()
 
 from src.framework import AgentFramework
 from src.utils.logging_utils import setup_logger, get_default_log_file
@@ -22,8 +22,8 @@ from src.utils.logging_utils import setup_logger, get_default_log_file
 def main():
     """Run the basic agent example."""
     
-    # Set up logging
-    log_file = os.getenv("LOG_FILE", get_default_log_file())
+    # Set up logging, only building the default log path when LOG_FILE is unset
+    log_file = os.getenv("LOG_FILE") or get_default_log_file()
     logger = setup_logger(
         name="basic_agent_example",
         level=os.getenv("LOG_LEVEL", "INFO"),
@@ -4,14 +4,14 @@ Context7 MCP integration example using the Autogen Agents Framework.
 
 import os
 import sys
-import dotenv
-from pathlib import Path
 
 # Add the parent directory to the Python path
-sys.path.append(str(Path(__file__).parent.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.bootstrap import load_env_once
 
 # Load environment variables from .env file
-dotenv.load_dotenv()
+load_env_once()
 
 from src.framework import AgentFramework
 from src.mcp.context7_client import Context7Client
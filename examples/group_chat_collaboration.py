@@ -4,21 +4,17 @@ Group chat collaboration example using the Autogen Agents Framework.
 
 import os
 import sys
-import dotenv
-from pathlib import Path
 
 # Add the parent directory to the Python path
-sys.path.append(str(Path(__file__).parent.parent))
-
-# Load environment variables from .env file
-dotenv.load_dotenv()
-
-from src.framework import AgentFramework
-from src.agents.group_chat import GroupChatManager
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 def main():
     """Run the group chat collaboration example."""
     
+    # Import the framework here so importing this module stays cheap
+    from src.framework import AgentFramework
+    from src.agents.group_chat import GroupChatManager
+    
     # Create a new agent framework
     framework = AgentFramework()
     
@@ -120,4 +116,9 @@ def main():
     )
 
 if __name__ == "__main__":
+    from src.bootstrap import load_env_once
+    
+    # Load environment variables from .env file
+    load_env_once()
+    
     main()
@@ -4,17 +4,49 @@ MCP server integration example using the Autogen Agents Framework.
 
 import os
 import sys
-import dotenv
-from pathlib import Path
 
 # Add the parent directory to the Python path
-sys.path.append(str(Path(__file__).parent.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.bootstrap import load_env_once
 
 # Load environment variables from .env file
-dotenv.load_dotenv()
+load_env_once()
 
 from src.framework import AgentFramework
-from src.mcp.mcp_client import MCPClient, MCPManager
+
+def demonstrate_mcp_interaction(framework: AgentFramework):
+    """
+    Demonstrate direct interaction with MCP servers.
+    
+    Args:
+        framework: Agent framework with the Context7 MCP server registered
+    """
+    print("Demonstrating direct MCP server interaction...")
+    
+    # Get the MCP manager
+    mcp_manager = framework.mcp_manager
+    
+    # Get the Context7 client
+    context7_client = mcp_manager.get_client("context7")
+    if context7_client is None:
+        print("Context7 client not found!")
+        return
+    
+    # Example: Resolve a library ID
+    try:
+        print("Resolving library ID for 'React'...")
+        result = context7_client.resolve_library_id("React")
+        print(f"Resolved library ID: {result}")
+        
+        # Get library documentation
+        if "libraryId" in result:
+            library_id = result["libraryId"]
+            print(f"Getting documentation for library ID: {library_id}...")
+            docs = context7_client.get_library_docs(library_id, tokens=5000)
+            print(f"Documentation retrieved: {len(docs)} characters")
+    except Exception as e:
+        print(f"Error interacting with MCP server: {e}")
 
 def main():
     """Run the MCP server integration example."""
@@ -54,35 +86,6 @@ def main():
         code_execution_config={"use_docker": False}
     )
     
-    # Define a custom function to demonstrate direct MCP server interaction
-    def demonstrate_mcp_interaction():
-        """Demonstrate direct interaction with MCP servers."""
-        print("Demonstrating direct MCP server interaction...")
-        
-        # Get the MCP manager
-        mcp_manager = framework.mcp_manager
-        
-        # Get the Context7 client
-        context7_client = mcp_manager.get_client("context7")
-        if context7_client is None:
-            print("Context7 client not found!")
-            return
-        
-        # Example: Resolve a library ID
-        try:
-            print("Resolving library ID for 'React'...")
-            result = context7_client.resolve_library_id("React")
-            print(f"Resolved library ID: {result}")
-            
-            # Get library documentation
-            if "libraryId" in result:
-                library_id = result["libraryId"]
-                print(f"Getting documentation for library ID: {library_id}...")
-                docs = context7_client.get_library_docs(library_id, tokens=5000)
-                print(f"Documentation retrieved: {len(docs)} characters")
-        except Exception as e:
-            print(f"Error interacting with MCP server: {e}")
-    
     # Start a conversation with the assistant
     print("Starting conversation with the MCP-enabled assistant...")
     framework.start_conversation(
@@ -91,9 +94,10 @@ def main():
         message="Can you tell me about React hooks using the Context7 MCP server?"
     )
     
-    # Demonstrate direct MCP interaction
+    # Demonstrate direct MCP interaction (DEMO_MCP=1)
     # Note: This would only work with actual MCP server credentials
-    # demonstrate_mcp_interaction()
+    if os.getenv("DEMO_MCP", "").lower() in ("1", "true", "yes"):
+        demonstrate_mcp_interaction(framework)
 
 if __name__ == "__main__":
     main()
@@ -4,85 +4,91 @@ Memory persistence example using the Autogen Agents Framework.
 
 import os
 import sys
-import dotenv
-from pathlib import Path
-import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the parent directory to the Python path
-sys.path.append(str(Path(__file__).parent.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.bootstrap import load_env_once
 
 # Load environment variables from .env file
-dotenv.load_dotenv()
+load_env_once()
 
 from src.framework import AgentFramework
-from src.utils.memory_manager import MemoryManager
+from src.utils.memory_manager import MemoryManager, new_conversation_id
+
+def seed_memories(memory_manager: MemoryManager, conversation_id: str):
+    """
+    Create the example conversation and store the assistant's memories from earlier conversations.
+    
+    Args:
+        memory_manager: Memory manager to write to
+        conversation_id: ID of the conversation to create
+    """
+    # Create a new conversation in memory and store some memories for the assistant,
+    # all in a single transaction
+    with memory_manager.transaction():
+        memory_manager.create_conversation(conversation_id, "Memory Demonstration")
+        memory_manager.store_memories_bulk([
+            ("MemoryAssistant", "user_preference", {
+                "preference_type": "color",
+                "value": "blue",
+                "confidence": 0.9,
+                "source": "user mentioned in previous conversation"
+            }),
+            ("MemoryAssistant", "user_fact", {
+                "fact_type": "hobby",
+                "value": "playing chess",
+                "confidence": 0.8,
+                "source": "user mentioned in previous conversation"
+            }),
+            ("MemoryAssistant", "conversation_summary",
+             "Previously discussed AI ethics and the importance of responsible AI development."),
+        ])
 
 def main():
     """Run the memory persistence example."""
     
-    # Create a new agent framework
-    framework = AgentFramework()
-    
     # Create a memory manager
     memory_manager = MemoryManager(db_path="agent_memories.db")
     
-    # Create an assistant agent
-    assistant = framework.create_agent(
-        agent_type="assistant",
-        name="MemoryAssistant",
-        description="An AI assistant that can remember information across conversations.",
-        system_message=(
-            "You are an AI assistant with memory capabilities. You can remember information "
-            "from previous conversations and recall it when needed. Try to remember important "
-            "details about the user and their preferences."
-        ),
-        human_input_mode="NEVER"
-    )
-    
-    # Create a user proxy agent
-    user_proxy = framework.create_agent(
-        agent_type="user_proxy",
-        name="User",
-        description="A proxy for the human user.",
-        system_message="You are a proxy for the human user. You can execute code and provide feedback.",
-        human_input_mode="ALWAYS",
-        code_execution_config={"use_docker": False}
-    )
-    
     # Generate a unique conversation ID
-    conversation_id = str(uuid.uuid4())
-    
-    # Create a new conversation in memory
-    memory_manager.create_conversation(conversation_id, "Memory Demonstration")
+    conversation_id = new_conversation_id()
     
-    # Store some memories for the assistant
-    memory_manager.store_memory(
-        agent_name="MemoryAssistant",
-        memory_type="user_preference",
-        content={
-            "preference_type": "color",
-            "value": "blue",
-            "confidence": 0.9,
-            "source": "user mentioned in previous conversation"
-        }
-    )
-    
-    memory_manager.store_memory(
-        agent_name="MemoryAssistant",
-        memory_type="user_fact",
-        content={
-            "fact_type": "hobby",
-            "value": "playing chess",
-            "confidence": 0.8,
-            "source": "user mentioned in previous conversation"
-        }
-    )
-    
-    memory_manager.store_memory(
-        agent_name="MemoryAssistant",
-        memory_type="conversation_summary",
-        content="Previously discussed AI ethics and the importance of responsible AI development."
-    )
+    # Write the seed memories in the background while the framework and agents are set up
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        seeding = executor.submit(seed_memories, memory_manager, conversation_id)
+        
+        try:
+            # Create a new agent framework
+            framework = AgentFramework()
+            
+            # Create an assistant agent
+            assistant = framework.create_agent(
+                agent_type="assistant",
+                name="MemoryAssistant",
+                description="An AI assistant that can remember information across conversations.",
+                system_message=(
+                    "You are an AI assistant with memory capabilities. You can remember information "
+                    "from previous conversations and recall it when needed. Try to remember important "
+                    "details about the user and their preferences."
+                ),
+                human_input_mode="NEVER"
+            )
+            
+            # Create a user proxy agent
+            user_proxy = framework.create_agent(
+                agent_type="user_proxy",
+                name="User",
+                description="A proxy for the human user.",
+                system_message="You are a proxy for the human user. You can execute code and provide feedback.",
+                human_input_mode="ALWAYS",
+                code_execution_config={"use_docker": False}
+            )
+        finally:
+            # Wait for the seed writes before the tools can read them, surfacing any
+            # seeding error even if setting up the agents failed
+            seeding.result()
     
     # Define a custom function to demonstrate memory retrieval
     def retrieve_agent_memory(agent_name, memory_type=None):
@@ -104,23 +110,6 @@ def main():
             "memories": memories
         }
     
-    # Register the memory retrieval function as a tool
-    framework.register_tool(
-        name="retrieve_memory",
-        description="Retrieve memories for an agent",
-        function=retrieve_agent_memory,
-        parameters={
-            "agent_name": {
-                "type": "string",
-                "description": "Name of the agent"
-            },
-            "memory_type": {
-                "type": "string",
-                "description": "Type of memory to retrieve (None for all types)"
-            }
-        }
-    )
-    
     # Define a function to store new memories
     def store_agent_memory(agent_name, memory_type, content):
         """
@@ -142,27 +131,6 @@ def main():
             "message": "Memory stored successfully" if success else "Failed to store memory"
         }
     
-    # Register the memory storage function as a tool
-    framework.register_tool(
-        name="store_memory",
-        description="Store a new memory for an agent",
-        function=store_agent_memory,
-        parameters={
-            "agent_name": {
-                "type": "string",
-                "description": "Name of the agent"
-            },
-            "memory_type": {
-                "type": "string",
-                "description": "Type of memory"
-            },
-            "content": {
-                "type": "object",
-                "description": "Memory content"
-            }
-        }
-    )
-    
     # Define a function to log conversation messages
     def log_message(sender, receiver, content):
         """
@@ -183,26 +151,62 @@ def main():
             "message": "Message logged successfully" if success else "Failed to log message"
         }
     
-    # Register the message logging function as a tool
-    framework.register_tool(
-        name="log_message",
-        description="Log a message in the conversation history",
-        function=log_message,
-        parameters={
-            "sender": {
-                "type": "string",
-                "description": "Name of the sender"
-            },
-            "receiver": {
-                "type": "string",
-                "description": "Name of the receiver"
-            },
-            "content": {
-                "type": "string",
-                "description": "Message content"
+    # Register the memory and logging functions as tools
+    framework.register_tools([
+        {
+            "name": "retrieve_memory",
+            "description": "Retrieve memories for an agent",
+            "function": retrieve_agent_memory,
+            "parameters": {
+                "agent_name": {
+                    "type": "string",
+                    "description": "Name of the agent"
+                },
+                "memory_type": {
+                    "type": "string",
+                    "description": "Type of memory to retrieve (None for all types)"
+                }
+            }
+        },
+        {
+            "name": "store_memory",
+            "description": "Store a new memory for an agent",
+            "function": store_agent_memory,
+            "parameters": {
+                "agent_name": {
+                    "type": "string",
+                    "description": "Name of the agent"
+                },
+                "memory_type": {
+                    "type": "string",
+                    "description": "Type of memory"
+                },
+                "content": {
+                    "type": "object",
+                    "description": "Memory content"
+                }
+            }
+        },
+        {
+            "name": "log_message",
+            "description": "Log a message in the conversation history",
+            "function": log_message,
+            "parameters": {
+                "sender": {
+                    "type": "string",
+                    "description": "Name of the sender"
+                },
+                "receiver": {
+                    "type": "string",
+                    "description": "Name of the receiver"
+                },
+                "content": {
+                    "type": "string",
+                    "description": "Message content"
+                }
             }
         }
-    )
+    ])
     
     # Start a conversation with the memory-enabled assistant
     print("Starting conversation with the memory-enabled assistant...")
@@ -4,20 +4,16 @@ Multi-agent collaboration example using the Autogen Agents Framework.
 
 import os
 import sys
-import dotenv
-from pathlib import Path
 
 # Add the parent directory to the Python path
-sys.path.append(str(Path(__file__).parent.parent))
-
-# Load environment variables from .env file
-dotenv.load_dotenv()
-
-from src.framework import AgentFramework
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 def main():
     """Run the multi-agent collaboration example."""
     
+    # Import the framework here so importing this module stays cheap
+    from src.framework import AgentFramework
+    
     # Create a new agent framework
     framework = AgentFramework()
     
@@ -132,4 +128,9 @@ def main():
     )
 
 if __name__ == "__main__":
+    from src.bootstrap import load_env_once
+    
+    # Load environment variables from .env file
+    load_env_once()
+    
     main()
@@ -4,24 +4,23 @@ Simple example demonstrating the memory manager with a basic conversation.
 
 import os
 import sys
-import uuid
-import dotenv
-from pathlib import Path
 
 # Add the parent directory to the Python path
-sys.path.append(str(Path(__file__).parent.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.bootstrap import load_env_once
 
 # Load environment variables from .env file
-dotenv.load_dotenv()
+load_env_once()
 
-from src.utils.memory_manager import MemoryManager
+from src.utils.memory_manager import MemoryManager, new_conversation_id
 from src.utils.logging_utils import setup_logger, get_default_log_file
 
 def main():
     """Run the simple memory example."""
     
     # Set up logging
-    log_file = os.getenv("LOG_FILE", get_default_log_file())
+    log_file = os.getenv("LOG_FILE") or get_default_log_file()
     logger = setup_logger(
         name="simple_memory_example",
         level=os.getenv("LOG_LEVEL", "INFO"),
@@ -35,65 +34,34 @@ def main():
     logger.info(f"Created memory manager with database at {memory_db_path}")
     
     # Generate a unique conversation ID
-    conversation_id = str(uuid.uuid4())
-    memory_manager.create_conversation(conversation_id, "Simple Memory Example")
-    logger.info(f"Created conversation with ID: {conversation_id}")
-    
-    # Store some memories
-    memory_manager.store_memory(
-        agent_name="Assistant",
-        memory_type="fact",
-        content={
-            "subject": "user",
-            "predicate": "likes",
-            "object": "Python programming"
-        }
-    )
-    logger.info("Stored fact memory for Assistant")
-    
-    memory_manager.store_memory(
-        agent_name="Assistant",
-        memory_type="skill",
-        content={
-            "skill_name": "coding",
-            "proficiency": "expert",
-            "description": "Ability to write clean, efficient Python code"
-        }
-    )
-    logger.info("Stored skill memory for Assistant")
-    
-    # Add some messages to the conversation
-    memory_manager.add_message(
-        conversation_id=conversation_id,
-        sender="User",
-        receiver="Assistant",
-        content="Hello, can you help me with a Python problem?"
-    )
-    logger.info("Added user message to conversation")
-    
-    memory_manager.add_message(
-        conversation_id=conversation_id,
-        sender="Assistant",
-        receiver="User",
-        content="Of course! I'd be happy to help with your Python problem. What specifically are you working on?"
-    )
-    logger.info("Added assistant message to conversation")
+    conversation_id = new_conversation_id()
     
-    memory_manager.add_message(
-        conversation_id=conversation_id,
-        sender="User",
-        receiver="Assistant",
-        content="I'm trying to implement a memory manager for my agents."
-    )
-    logger.info("Added user message to conversation")
-    
-    memory_manager.add_message(
-        conversation_id=conversation_id,
-        sender="Assistant",
-        receiver="User",
-        content="That's a great project! A memory manager is essential for maintaining context and knowledge across conversations. Would you like me to help you design the database schema for it?"
-    )
-    logger.info("Added assistant message to conversation")
+    # Create the conversation, store some memories and add some messages in a single transaction
+    with memory_manager.transaction():
+        memory_manager.create_conversation(conversation_id, "Simple Memory Example")
+        
+        memory_manager.store_memories_bulk([
+            ("Assistant", "fact", {
+                "subject": "user",
+                "predicate": "likes",
+                "object": "Python programming"
+            }),
+            ("Assistant", "skill", {
+                "skill_name": "coding",
+                "proficiency": "expert",
+                "description": "Ability to write clean, efficient Python code"
+            }),
+        ])
+        
+        memory_manager.add_messages_bulk(conversation_id, [
+            ("User", "Assistant", "Hello, can you help me with a Python problem?"),
+            ("Assistant", "User", "Of course! I'd be happy to help with your Python problem. What specifically are you working on?"),
+            ("User", "Assistant", "I'm trying to implement a memory manager for my agents."),
+            ("Assistant", "User", "That's a great project! A memory manager is essential for maintaining context and knowledge across conversations. Would you like me to help you design the database schema for it?"),
+        ])
+    logger.info(f"Created conversation with ID: {conversation_id}")
+    logger.info("Stored fact and skill memories for Assistant")
+    logger.info("Added 4 messages to conversation")
     
     # Retrieve and print conversation history
     print("\n=== Conversation History ===")
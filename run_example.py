@@ -3,17 +3,24 @@
 Script to run examples from the Autogen Agents Framework.
 """
 
+import functools
 import os
 import sys
-import argparse
-import runpy
 from pathlib import Path
 
+# Directory containing the example scripts
+EXAMPLES_DIR = Path(__file__).parent / "examples"
+
+@functools.lru_cache(maxsize=None)
 def list_examples():
     """List all available examples."""
-    examples_dir = Path(__file__).parent / "examples"
-    examples = [f.stem for f in examples_dir.glob("*.py") if f.is_file()]
-    return sorted(examples)
+    # DirEntry caches the file type from the directory read, so this needs no extra stat calls
+    with os.scandir(EXAMPLES_DIR) as entries:
+        examples = [
+            entry.name[:-3] for entry in entries
+            if entry.name.endswith(".py") and entry.is_file(follow_symlinks=False)
+        ]
+    return tuple(sorted(examples))
 
 def run_example(example_name):
     """
@@ -22,9 +29,8 @@ def run_example(example_name):
     Args:
         example_name: Name of the example to run
     """
-    # Check if the example exists
-    example_path = Path(__file__).parent / "examples" / f"{example_name}.py"
-    if not example_path.exists():
+    # Check if the example exists, using the same directory scan as the list of alternatives
+    if example_name not in list_examples():
         print(f"Error: Example '{example_name}' not found.")
         print("Available examples:")
         for example in list_examples():
@@ -35,22 +41,26 @@ def run_example(example_name):
     sys.path.append(str(Path(__file__).parent))
     
     # Run the example
+    example_path = EXAMPLES_DIR / f"{example_name}.py"
     print(f"Running example: {example_name}")
     print("-" * 80)
     
     # Run the example script directly
     try:
         # Use runpy to execute the script
+        import runpy
         runpy.run_path(str(example_path), run_name="__main__")
     except Exception as e:
         print(f"Error running example '{example_name}': {e}")
         import traceback
-        traceback.print_exc()
+        sys.stderr.write("".join(traceback.format_exception(type(e), e, e.__traceback__)))
         return 1
     
     return 0
 
 if __name__ == "__main__":
+    import argparse
+    
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="Run examples from the Autogen Agents Framework")
     parser.add_argument("example", nargs="?", help="Name of the example to run")
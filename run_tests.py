@@ -5,8 +5,6 @@ Script to run all tests for the Autogen Agents Framework.
 
 import os
 import sys
-import unittest
-import argparse
 from pathlib import Path
 
 def run_tests(test_path=None, verbose=False):
@@ -17,15 +15,25 @@ def run_tests(test_path=None, verbose=False):
         test_path: Path to the test directory or file
         verbose: Whether to show verbose output
     """
+    import unittest
+    
     # Set up the test loader
     loader = unittest.TestLoader()
     
     # Determine the test path
+    root_dir = os.path.dirname(os.path.abspath(__file__))
     if test_path is None:
-        test_path = os.path.join(os.path.dirname(__file__), "tests")
+        test_path = os.path.join(root_dir, "tests")
     
-    # Discover and run tests
-    suite = loader.discover(test_path)
+    # Discover and run tests; a single test file only imports that module
+    if test_path.endswith(".py"):
+        suite = loader.discover(
+            os.path.dirname(os.path.abspath(test_path)),
+            pattern=os.path.basename(test_path),
+            top_level_dir=root_dir
+        )
+    else:
+        suite = loader.discover(test_path, top_level_dir=root_dir)
     
     # Set up the test runner
     runner = unittest.TextTestRunner(verbosity=2 if verbose else 1)
@@ -37,6 +45,8 @@ def run_tests(test_path=None, verbose=False):
     return 0 if result.wasSuccessful() else 1
 
 if __name__ == "__main__":
+    import argparse
+    
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="Run tests for the Autogen Agents Framework")
     parser.add_argument("--path", help="Path to the test directory or file")
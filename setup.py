@@ -27,6 +27,9 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={
+        "fast-json": ["orjson>=3.8"],
+    },
     entry_points={
         "console_scripts": [
             "autogen-framework=src.cli:main",
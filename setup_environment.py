@@ -6,6 +6,7 @@ Script to set up the environment for the Autogen Agents Framework.
 import os
 import sys
 import argparse
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -31,10 +32,25 @@ def install_dependencies(dev=False):
     
     print(f"Installing dependencies from {requirements_file}...")
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", requirements_file])
+        # Skip pip's self-update check and prefer wheels over source builds; pip's output
+        # is collected and written in one go instead of line by line
+        result = subprocess.run(
+            [
+                sys.executable, "-m", "pip", "install",
+                "--no-input", "--disable-pip-version-check", "--prefer-binary",
+                "-r", requirements_file
+            ],
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            env={**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1", "PYTHONDONTWRITEBYTECODE": "1"}
+        )
+        sys.stdout.write(result.stdout)
         print("Dependencies installed successfully.")
         return True
     except subprocess.CalledProcessError as e:
+        sys.stdout.write(e.stdout or "")
         print(f"Error installing dependencies: {e}")
         return False
 
@@ -52,11 +68,7 @@ def setup_env_file():
         return
     
     # Copy the example file to .env
-    with open(env_example_file, "r") as example_file:
-        example_content = example_file.read()
-    
-    with open(env_file, "w") as env_file_obj:
-        env_file_obj.write(example_content)
+    shutil.copyfile(env_example_file, env_file)
     
     print(f"Created {env_file} from {env_example_file}.")
     print("Please update the .env file with your credentials.")
@@ -69,13 +81,25 @@ def make_scripts_executable():
         "run_example.py"
     ]
     
+    # Windows has no executable permission bits
+    if os.name == "nt":
+        return
+    
     for script in scripts:
-        if Path(script).exists():
-            try:
-                os.chmod(script, 0o755)
-                print(f"Made {script} executable.")
-            except Exception as e:
-                print(f"Error making {script} executable: {e}")
+        try:
+            mode = os.stat(script).st_mode
+        except FileNotFoundError:
+            continue
+        
+        # Skip scripts that are already executable
+        if mode & 0o111 == 0o111:
+            continue
+        
+        try:
+            os.chmod(script, 0o755)
+            print(f"Made {script} executable.")
+        except Exception as e:
+            print(f"Error making {script} executable: {e}")
 
 def main():
     """Main entry point for the script."""
@@ -2,11 +2,16 @@
 Assistant agent implementation for the Autogen Agents Framework.
 """
 
-import autogen
-from typing import Dict, Any, List, Optional, Callable
-from .base_agent import BaseAgent
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Callable
+from .base_agent import BaseAgent, _cached_from_config
 from ..config.config_manager import AgentConfig
 
+if TYPE_CHECKING:
+    import autogen
+
 class AssistantAgent(BaseAgent):
     """
     Assistant agent that can help with various tasks.
@@ -47,31 +52,30 @@ class AssistantAgent(BaseAgent):
     
     def _create_agent(self) -> autogen.AssistantAgent:
         """Create the underlying Autogen assistant agent."""
-        return autogen.AssistantAgent(
-            name=self.name,
-            system_message=self.system_message,
-            llm_config=self.llm_config,
-            human_input_mode=self.human_input_mode,
-            function_map={tool["name"]: tool["function"] for tool in self.tools if "function" in tool},
-            is_termination_msg=self.is_termination_msg,
-        )
+        import autogen
+        
+        return autogen.AssistantAgent(**self._agent_kwargs())
     
     @classmethod
-    def from_config(cls, config: AgentConfig, tools: Optional[List[Dict[str, Any]]] = None):
+    def from_config(cls, config: AgentConfig, tools: Optional[List[Dict[str, Any]]] = None, cache: bool = False):
         """
         Create an assistant agent from a configuration object.
         
         Args:
             config: Agent configuration
             tools: List of tools available to the agent
+            cache: Whether to return the agent already created from the same config and tools objects; agents are
+                matched by object identity, so an equal but separate config creates a new agent
             
         Returns:
-            A new AssistantAgent instance
+            A new AssistantAgent instance, or the cached one
         """
-        return cls(
+        create = functools.partial(
+            cls,
             name=config.name,
             description=config.description,
             system_message=config.system_message,
             llm_config=config.llm_config,
             tools=tools,
         )
+        return _cached_from_config((cls, config, tools), create) if cache else create()
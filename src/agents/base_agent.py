@@ -2,10 +2,45 @@
 Base agent implementation for the Autogen Agents Framework.
 """
 
-import autogen
-from typing import Dict, Any, List, Optional, Union, Callable
+from __future__ import annotations
+
+import functools
+import threading
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple, Union, Callable
 from ..config.config_manager import AgentConfig
 
+if TYPE_CHECKING:
+    import autogen
+
+# Agents created by from_config(cache=True), keyed by the identity of their arguments.
+# Each entry also holds the arguments themselves so their ids can't be reused.
+_FROM_CONFIG_CACHE: Dict[Tuple[int, ...], Tuple["BaseAgent", Tuple[Any, ...]]] = {}
+_FROM_CONFIG_CACHE_SIZE = 256
+
+def _cached_from_config(arguments: Tuple[Any, ...], create: Callable[[], "BaseAgent"]) -> "BaseAgent":
+    """
+    Return the agent previously created from the same arguments, creating it on a miss.
+    
+    Args:
+        arguments: Agent class and from_config arguments identifying the agent
+        create: Function creating the agent
+        
+    Returns:
+        The shared agent instance
+    """
+    key = tuple(id(argument) for argument in arguments)
+    entry = _FROM_CONFIG_CACHE.get(key)
+    if entry is not None:
+        return entry[0]
+    
+    agent = create()
+    _FROM_CONFIG_CACHE[key] = (agent, arguments)
+    
+    # Evict the oldest entry once the cache is full
+    if len(_FROM_CONFIG_CACHE) > _FROM_CONFIG_CACHE_SIZE:
+        del _FROM_CONFIG_CACHE[next(iter(_FROM_CONFIG_CACHE))]
+    return agent
+
 class BaseAgent:
     """Base class for all agents in the framework."""
     
@@ -35,21 +70,46 @@ class BaseAgent:
         self.description = description
         self.system_message = system_message
         self.llm_config = llm_config
-        self.tools = tools or []
+        self.tools = list(tools) if tools else []
         self.is_termination_msg = is_termination_msg
         self.human_input_mode = human_input_mode
-        self.agent = self._create_agent()
+        
+        # Callable tools indexed by name; a later tool replaces an earlier one with the same name
+        self._tool_map: Dict[str, Dict[str, Any]] = {tool["name"]: tool for tool in self.tools if "function" in tool}
+        
+        # The Autogen agent is created on first use
+        self._agent: Optional[autogen.ConversableAgent] = None
+        self._agent_lock = threading.Lock()
+    
+    @property
+    def agent(self) -> autogen.ConversableAgent:
+        """The underlying Autogen agent, created the first time it is accessed."""
+        if self._agent is None:
+            with self._agent_lock:
+                if self._agent is None:
+                    self._agent = self._create_agent()
+        return self._agent
+    
+    def _function_map(self) -> Dict[str, Callable]:
+        """Map tool names to the functions implementing them, for the Autogen agent."""
+        return {name: tool["function"] for name, tool in self._tool_map.items()}
+    
+    def _agent_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments shared by every Autogen agent constructor."""
+        return {
+            "name": self.name,
+            "system_message": self.system_message,
+            "llm_config": self.llm_config,
+            "human_input_mode": self.human_input_mode,
+            "function_map": self._function_map(),
+            "is_termination_msg": self.is_termination_msg,
+        }
     
     def _create_agent(self) -> autogen.ConversableAgent:
         """Create the underlying Autogen agent."""
-        return autogen.ConversableAgent(
-            name=self.name,
-            system_message=self.system_message,
-            llm_config=self.llm_config,
-            human_input_mode=self.human_input_mode,
-            function_map={tool["name"]: tool["function"] for tool in self.tools if "function" in tool},
-            is_termination_msg=self.is_termination_msg,
-        )
+        import autogen
+        
+        return autogen.ConversableAgent(**self._agent_kwargs())
     
     def register_tool(self, tool_name: str, tool_function: Callable, tool_description: str):
         """
@@ -66,7 +126,11 @@ class BaseAgent:
             "description": tool_description
         }
         self.tools.append(tool)
-        self.agent.register_function(function=tool_function, name=tool_name, description=tool_description)
+        self._tool_map[tool_name] = tool
+        
+        # An agent that hasn't been created yet picks the tool up from the tool map
+        if self._agent is not None:
+            self._agent.register_function(function=tool_function, name=tool_name, description=tool_description)
     
     def send_message(self, message: str, recipient: Union[autogen.ConversableAgent, 'BaseAgent']):
         """
@@ -93,21 +157,25 @@ class BaseAgent:
         self.agent.initiate_chat(recipient, message=message)
     
     @classmethod
-    def from_config(cls, config: AgentConfig, tools: Optional[List[Dict[str, Any]]] = None):
+    def from_config(cls, config: AgentConfig, tools: Optional[List[Dict[str, Any]]] = None, cache: bool = False):
         """
         Create an agent from a configuration object.
         
         Args:
             config: Agent configuration
             tools: List of tools available to the agent
+            cache: Whether to return the agent already created from the same config and tools objects; agents are
+                matched by object identity, so an equal but separate config creates a new agent
             
         Returns:
-            A new BaseAgent instance
+            A new BaseAgent instance, or the cached one
         """
-        return cls(
+        create = functools.partial(
+            cls,
             name=config.name,
             description=config.description,
             system_message=config.system_message,
             llm_config=config.llm_config,
             tools=tools,
         )
+        return _cached_from_config((cls, config, tools), create) if cache else create()
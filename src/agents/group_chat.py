@@ -2,16 +2,31 @@
 Group chat implementation for the Autogen Agents Framework.
 """
 
-import autogen
-from typing import Dict, Any, List, Optional, Union, Callable
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Union, Callable
 from .base_agent import BaseAgent
 
+if TYPE_CHECKING:
+    import autogen
+
 class GroupChat:
     """
     Group chat for multiple agents to collaborate.
     This class manages conversations between multiple agents in a group setting.
     """
     
+    __slots__ = (
+        "agents",
+        "autogen_agents",
+        "group_chat",
+        "_agents_by_name",
+        "_speaker_positions",
+        "_speaker_selection_method",
+        "_allow_repeat_speaker",
+    )
+    
     def __init__(
         self,
         agents: List[Union[BaseAgent, autogen.ConversableAgent]],
@@ -30,20 +45,34 @@ class GroupChat:
             speaker_selection_method: Method for selecting the next speaker ("auto", "round_robin", or "random")
             allow_repeat_speaker: Whether to allow the same speaker to speak multiple times in a row
         """
-        self.agents = []
-        self.autogen_agents = []
+        framework_agents = []
+        autogen_agents = []
         
         # Process agents to ensure they are all autogen.ConversableAgent instances
         for agent in agents:
             if isinstance(agent, BaseAgent):
-                self.agents.append(agent)
-                self.autogen_agents.append(agent.agent)
+                framework_agents.append(agent)
+                autogen_agents.append(agent.agent)
             else:
-                self.autogen_agents.append(agent)
+                autogen_agents.append(agent)
+        
+        # The participants don't change after construction
+        self.agents = tuple(framework_agents)
+        self.autogen_agents = tuple(autogen_agents)
+        
+        # Index agents by name for get_agent_by_name; the first agent with a name wins
+        self._agents_by_name = {agent.name: agent for agent in reversed(self.agents)}
+        
+        # Positions of the participants by name, for round robin speaker selection
+        self._speaker_positions = {agent.name: i for i, agent in reversed(list(enumerate(self.autogen_agents)))}
+        self._speaker_selection_method = speaker_selection_method.lower()
+        self._allow_repeat_speaker = allow_repeat_speaker
         
         # Create the autogen group chat
+        import autogen
+        
         self.group_chat = autogen.GroupChat(
-            agents=self.autogen_agents,
+            agents=autogen_agents,
             messages=messages or [],
             max_round=max_round,
             speaker_selection_method=speaker_selection_method,
@@ -63,17 +92,35 @@ class GroupChat:
         """
         self.group_chat.append_message(message)
     
-    def select_speaker(self, last_speaker: Optional[autogen.ConversableAgent] = None) -> autogen.ConversableAgent:
+    def select_speaker(
+        self,
+        last_speaker: Optional[autogen.ConversableAgent] = None,
+        selector: Optional[autogen.ConversableAgent] = None
+    ) -> autogen.ConversableAgent:
         """
         Select the next speaker.
         
+        Round robin and random selection are resolved directly; other methods are
+        delegated to Autogen.
+        
         Args:
             last_speaker: Last speaker in the conversation
+            selector: Agent used by Autogen to select the speaker in "auto" mode
             
         Returns:
             Next speaker
         """
-        return self.group_chat.select_speaker(last_speaker)
+        if self._speaker_selection_method == "round_robin":
+            position = self._speaker_positions.get(last_speaker.name, -1) if last_speaker is not None else -1
+            return self.autogen_agents[(position + 1) % len(self.autogen_agents)]
+        
+        if self._speaker_selection_method == "random":
+            candidates = self.autogen_agents
+            if not self._allow_repeat_speaker and last_speaker is not None:
+                candidates = [agent for agent in candidates if agent is not last_speaker] or candidates
+            return random.choice(candidates)
+        
+        return self.group_chat.select_speaker(last_speaker, selector)
     
     def messages_to_str(self) -> str:
         """
@@ -94,10 +141,7 @@ class GroupChat:
         Returns:
             The agent, or None if not found
         """
-        for agent in self.agents:
-            if agent.name == name:
-                return agent
-        return None
+        return self._agents_by_name.get(name)
     
     def initiate_chat(self, manager: Union[BaseAgent, autogen.ConversableAgent], message: str):
         """
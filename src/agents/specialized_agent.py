@@ -2,8 +2,9 @@
 Specialized agent implementation for the Autogen Agents Framework.
 """
 
+import functools
 from typing import Dict, Any, List, Optional, Callable
-from .base_agent import BaseAgent
+from .base_agent import BaseAgent, _cached_from_config
 from ..config.config_manager import AgentConfig
 
 class SpecializedAgent(BaseAgent):
@@ -68,34 +69,38 @@ class SpecializedAgent(BaseAgent):
         domain_guidelines = self.domain_knowledge.get("guidelines", [])
         domain_examples = self.domain_knowledge.get("examples", [])
         
-        # Build enhanced system message
-        enhanced_message = f"{system_message}\n\n"
-        enhanced_message += f"Domain of specialization: {self.domain}\n\n"
+        # Build enhanced system message from its parts in a single join
+        parts = [f"{system_message}\n\n", f"Domain of specialization: {self.domain}\n\n"]
         
         if domain_instructions:
-            enhanced_message += f"Domain-specific instructions:\n{domain_instructions}\n\n"
+            parts.append(f"Domain-specific instructions:\n{domain_instructions}\n\n")
         
         if domain_guidelines:
-            enhanced_message += "Domain-specific guidelines:\n"
-            for i, guideline in enumerate(domain_guidelines, 1):
-                enhanced_message += f"{i}. {guideline}\n"
-            enhanced_message += "\n"
+            parts.append("Domain-specific guidelines:\n")
+            parts.extend(f"{i}. {guideline}\n" for i, guideline in enumerate(domain_guidelines, 1))
+            parts.append("\n")
         
         if domain_examples:
-            enhanced_message += "Domain-specific examples:\n"
+            parts.append("Domain-specific examples:\n")
             for i, example in enumerate(domain_examples, 1):
-                enhanced_message += f"Example {i}:\n"
+                parts.append(f"Example {i}:\n")
                 if isinstance(example, dict):
-                    for key, value in example.items():
-                        enhanced_message += f"- {key}: {value}\n"
+                    parts.extend(f"- {key}: {value}\n" for key, value in example.items())
                 else:
-                    enhanced_message += f"{example}\n"
-                enhanced_message += "\n"
+                    parts.append(f"{example}\n")
+                parts.append("\n")
         
-        return enhanced_message
+        return "".join(parts)
     
     @classmethod
-    def from_config(cls, config: AgentConfig, domain: str, domain_knowledge: Dict[str, Any], tools: Optional[List[Dict[str, Any]]] = None):
+    def from_config(
+        cls,
+        config: AgentConfig,
+        domain: str,
+        domain_knowledge: Dict[str, Any],
+        tools: Optional[List[Dict[str, Any]]] = None,
+        cache: bool = False
+    ):
         """
         Create a specialized agent from a configuration object.
         
@@ -104,11 +109,14 @@ class SpecializedAgent(BaseAgent):
             domain: Domain of specialization
             domain_knowledge: Domain-specific knowledge and configuration
             tools: List of tools available to the agent
+            cache: Whether to return the agent already created from the same argument objects; agents are
+                matched by object identity, so an equal but separate config creates a new agent
             
         Returns:
-            A new SpecializedAgent instance
+            A new SpecializedAgent instance, or the cached one
         """
-        return cls(
+        create = functools.partial(
+            cls,
             name=config.name,
             description=config.description,
             system_message=config.system_message,
@@ -117,3 +125,4 @@ class SpecializedAgent(BaseAgent):
             domain_knowledge=domain_knowledge,
             tools=tools,
         )
+        return _cached_from_config((cls, config, domain, domain_knowledge, tools), create) if cache else create()
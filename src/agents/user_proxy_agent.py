@@ -2,11 +2,16 @@
 User proxy agent implementation for the Autogen Agents Framework.
 """
 
-import autogen
-from typing import Dict, Any, List, Optional, Callable, Union
-from .base_agent import BaseAgent
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Callable, Union
+from .base_agent import BaseAgent, _cached_from_config
 from ..config.config_manager import AgentConfig
 
+if TYPE_CHECKING:
+    import autogen
+
 class UserProxyAgent(BaseAgent):
     """
     User proxy agent that represents a human user in the agent system.
@@ -50,15 +55,11 @@ class UserProxyAgent(BaseAgent):
     
     def _create_agent(self) -> autogen.UserProxyAgent:
         """Create the underlying Autogen user proxy agent."""
-        return autogen.UserProxyAgent(
-            name=self.name,
-            system_message=self.system_message,
-            human_input_mode=self.human_input_mode,
-            function_map={tool["name"]: tool["function"] for tool in self.tools if "function" in tool},
-            code_execution_config=self.code_execution_config,
-            llm_config=self.llm_config if self.llm_config else None,
-            is_termination_msg=self.is_termination_msg,
-        )
+        import autogen
+        
+        kwargs = self._agent_kwargs()
+        kwargs["llm_config"] = self.llm_config if self.llm_config else None
+        return autogen.UserProxyAgent(**kwargs, code_execution_config=self.code_execution_config)
     
     def execute_code(self, code: str, lang: str = "python") -> str:
         """
@@ -86,7 +87,13 @@ class UserProxyAgent(BaseAgent):
         return self.agent.get_human_feedback(prompt)
     
     @classmethod
-    def from_config(cls, config: AgentConfig, tools: Optional[List[Dict[str, Any]]] = None, code_execution_config: Optional[Dict[str, Any]] = None):
+    def from_config(
+        cls,
+        config: AgentConfig,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        code_execution_config: Optional[Dict[str, Any]] = None,
+        cache: bool = False
+    ):
         """
         Create a user proxy agent from a configuration object.
         
@@ -94,11 +101,14 @@ class UserProxyAgent(BaseAgent):
             config: Agent configuration
             tools: List of tools available to the agent
             code_execution_config: Configuration for code execution
+            cache: Whether to return the agent already created from the same argument objects; agents are
+                matched by object identity, so an equal but separate config creates a new agent
             
         Returns:
-            A new UserProxyAgent instance
+            A new UserProxyAgent instance, or the cached one
         """
-        return cls(
+        create = functools.partial(
+            cls,
             name=config.name,
             description=config.description,
             system_message=config.system_message,
@@ -106,3 +116,4 @@ class UserProxyAgent(BaseAgent):
             tools=tools,
             code_execution_config=code_execution_config,
         )
+        return _cached_from_config((cls, config, tools, code_execution_config), create) if cache else create()
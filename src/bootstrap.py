@@ -0,0 +1,19 @@
+"""
+Process start-up helpers for the Autogen Agents Framework.
+"""
+
+import dotenv
+
+_ENV_LOADED = False
+
+def load_env_once() -> None:
+    """
+    Load environment variables from the .env file.
+    
+    The file is read and parsed only on the first call in a process;
+    later calls return immediately.
+    """
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        dotenv.load_dotenv()
+        _ENV_LOADED = True
@@ -6,28 +6,74 @@ import os
 import sys
 import argparse
 import json
+import functools
 from pathlib import Path
-import dotenv
+from .bootstrap import load_env_once
 
-from .framework import AgentFramework
-from .utils.memory_manager import MemoryManager
-from .utils.logging_utils import setup_logger, get_default_log_file
-from .config.config_manager import ConfigManager
+# Allowed values of the --type and --human-input-mode arguments
+_AGENT_TYPES = ("assistant", "user_proxy", "specialized")
+_HUMAN_INPUT_MODES = ("ALWAYS", "NEVER", "TERMINATE")
+
+# Domain knowledge of the specialized group chat agents
+_RESEARCH_KNOWLEDGE = {
+    "instructions": "You are a research specialist. Focus on finding and analyzing information.",
+    "guidelines": (
+        "Always cite your sources",
+        "Consider multiple perspectives",
+        "Distinguish between facts and opinions"
+    )
+}
+
+_CODING_KNOWLEDGE = {
+    "instructions": "You are a coding specialist. Focus on writing clean, efficient code.",
+    "guidelines": (
+        "Follow language-specific best practices",
+        "Write code that is easy to understand",
+        "Include comments for complex logic"
+    )
+}
+
+_PLANNING_KNOWLEDGE = {
+    "instructions": "You are a planning specialist. Focus on organizing tasks and creating plans.",
+    "guidelines": (
+        "Break down complex problems into manageable steps",
+        "Prioritize tasks based on importance",
+        "Set realistic timelines"
+    )
+}
+
+@functools.lru_cache(maxsize=1)
+def _get_cli_logger(level: str, log_file: str):
+    """
+    Set up the CLI logger, reusing it while the level and log file are unchanged.
+    
+    Args:
+        level: Logging level name
+        log_file: Path to the log file
+        
+    Returns:
+        Configured logger instance
+    """
+    from .utils.logging_utils import setup_logger
+    
+    return setup_logger(name="autogen_framework_cli", level=level, log_file=log_file)
 
 def create_agent_command(args):
     """Create an agent from the command line."""
+    from .framework import AgentFramework
+    from .utils.logging_utils import get_default_log_file
+    
     # Load environment variables
-    dotenv.load_dotenv()
+    load_env_once()
     
     # Set up logging
-    logger = setup_logger(
-        name="autogen_framework_cli",
+    logger = _get_cli_logger(
         level=os.getenv("LOG_LEVEL", "INFO"),
-        log_file=os.getenv("LOG_FILE", get_default_log_file())
+        log_file=os.getenv("LOG_FILE") or get_default_log_file()
     )
     
     # Create a framework instance
-    framework = AgentFramework()
+    framework = AgentFramework(load_env=False)
     
     # Create the agent
     agent = framework.create_agent(
@@ -50,24 +96,22 @@ def create_agent_command(args):
 
 def run_conversation_command(args):
     """Run a conversation from the command line."""
+    from .framework import AgentFramework
+    from .utils.memory_manager import MemoryManager
+    from .utils.logging_utils import get_default_log_file
+    
     # Load environment variables
-    dotenv.load_dotenv()
+    load_env_once()
     
     # Set up logging
-    logger = setup_logger(
-        name="autogen_framework_cli",
+    logger = _get_cli_logger(
         level=os.getenv("LOG_LEVEL", "INFO"),
-        log_file=os.getenv("LOG_FILE", get_default_log_file())
+        log_file=os.getenv("LOG_FILE") or get_default_log_file()
     )
     
-    # Create a framework instance
-    framework = AgentFramework()
-    
-    # Load configuration if provided
+    # Create a framework instance, loading the configuration file if provided
+    framework = AgentFramework(args.config, load_env=False)
     if args.config:
-        config_manager = ConfigManager()
-        config = config_manager.load_from_file(args.config)
-        framework.load_config(config)
         logger.info(f"Loaded configuration from: {args.config}")
     
     # Create a memory manager if enabled
@@ -106,24 +150,22 @@ def run_conversation_command(args):
 
 def run_group_chat_command(args):
     """Run a group chat from the command line."""
+    from .framework import AgentFramework
+    from .utils.memory_manager import MemoryManager
+    from .utils.logging_utils import get_default_log_file
+    
     # Load environment variables
-    dotenv.load_dotenv()
+    load_env_once()
     
     # Set up logging
-    logger = setup_logger(
-        name="autogen_framework_cli",
+    logger = _get_cli_logger(
         level=os.getenv("LOG_LEVEL", "INFO"),
-        log_file=os.getenv("LOG_FILE", get_default_log_file())
+        log_file=os.getenv("LOG_FILE") or get_default_log_file()
     )
     
-    # Create a framework instance
-    framework = AgentFramework()
-    
-    # Load configuration if provided
+    # Create a framework instance, loading the configuration file if provided
+    framework = AgentFramework(args.config, load_env=False)
     if args.config:
-        config_manager = ConfigManager()
-        config = config_manager.load_from_file(args.config)
-        framework.load_config(config)
         logger.info(f"Loaded configuration from: {args.config}")
     
     # Create a memory manager if enabled
@@ -138,59 +180,35 @@ def run_group_chat_command(args):
     # Create specialized agents if requested
     if args.specialized:
         # Research agent
-        research_knowledge = {
-            "instructions": "You are a research specialist. Focus on finding and analyzing information.",
-            "guidelines": [
-                "Always cite your sources",
-                "Consider multiple perspectives",
-                "Distinguish between facts and opinions"
-            ]
-        }
         researcher = framework.create_agent(
             agent_type="specialized",
             name="Researcher",
             description="Research specialist",
             system_message="You are a research specialist in a group chat.",
             domain="research",
-            domain_knowledge=research_knowledge
+            domain_knowledge=_RESEARCH_KNOWLEDGE
         )
         agents.append(researcher)
         
         # Coding agent
-        coding_knowledge = {
-            "instructions": "You are a coding specialist. Focus on writing clean, efficient code.",
-            "guidelines": [
-                "Follow language-specific best practices",
-                "Write code that is easy to understand",
-                "Include comments for complex logic"
-            ]
-        }
         coder = framework.create_agent(
             agent_type="specialized",
             name="Coder",
             description="Coding specialist",
             system_message="You are a coding specialist in a group chat.",
             domain="coding",
-            domain_knowledge=coding_knowledge
+            domain_knowledge=_CODING_KNOWLEDGE
         )
         agents.append(coder)
         
         # Planning agent
-        planning_knowledge = {
-            "instructions": "You are a planning specialist. Focus on organizing tasks and creating plans.",
-            "guidelines": [
-                "Break down complex problems into manageable steps",
-                "Prioritize tasks based on importance",
-                "Set realistic timelines"
-            ]
-        }
         planner = framework.create_agent(
             agent_type="specialized",
             name="Planner",
             description="Planning specialist",
             system_message="You are a planning specialist in a group chat.",
             domain="planning",
-            domain_knowledge=planning_knowledge
+            domain_knowledge=_PLANNING_KNOWLEDGE
         )
         agents.append(planner)
     
@@ -234,55 +252,67 @@ def run_group_chat_command(args):
         message=args.message
     )
 
+def _add_create_agent_args(parser):
+    """Add the arguments of the "create-agent" command."""
+    parser.add_argument("--type", "-t", required=True, choices=_AGENT_TYPES, help="Type of agent to create")
+    parser.add_argument("--name", "-n", required=True, help="Name of the agent")
+    parser.add_argument("--description", "-d", default="", help="Description of the agent")
+    parser.add_argument("--system-message", "-s", required=True, help="System message for the agent")
+    parser.add_argument("--human-input-mode", choices=_HUMAN_INPUT_MODES, default="NEVER", help="Human input mode")
+    parser.add_argument("--save-config", help="Path to save the configuration")
+
+def _add_run_conversation_args(parser):
+    """Add the arguments of the "run-conversation" command."""
+    parser.add_argument("--config", "-c", help="Path to a configuration file")
+    parser.add_argument("--assistant-name", default="Assistant", help="Name of the assistant agent")
+    parser.add_argument("--assistant-system-message", default="You are a helpful AI assistant.", help="System message for the assistant agent")
+    parser.add_argument("--user-name", default="User", help="Name of the user proxy agent")
+    parser.add_argument("--human-input-mode", choices=_HUMAN_INPUT_MODES, default="ALWAYS", help="Human input mode")
+    parser.add_argument("--use-docker", action="store_true", help="Use Docker for code execution")
+    parser.add_argument("--memory", action="store_true", help="Enable memory persistence")
+    parser.add_argument("--message", "-m", required=True, help="Initial message to start the conversation")
+
+def _add_run_group_chat_args(parser):
+    """Add the arguments of the "run-group-chat" command."""
+    parser.add_argument("--config", "-c", help="Path to a configuration file")
+    parser.add_argument("--specialized", action="store_true", help="Include specialized agents in the group chat")
+    parser.add_argument("--user-name", default="User", help="Name of the user proxy agent")
+    parser.add_argument("--human-input-mode", choices=_HUMAN_INPUT_MODES, default="ALWAYS", help="Human input mode")
+    parser.add_argument("--use-docker", action="store_true", help="Use Docker for code execution")
+    parser.add_argument("--memory", action="store_true", help="Enable memory persistence")
+    parser.add_argument("--max-round", type=int, default=10, help="Maximum number of rounds for the group chat")
+    parser.add_argument("--message", "-m", required=True, help="Initial message to start the group chat")
+
+# Command name -> (handler, function adding the command's arguments, help text)
+COMMANDS = {
+    "create-agent": (create_agent_command, _add_create_agent_args, "Create an agent"),
+    "run-conversation": (run_conversation_command, _add_run_conversation_args, "Run a conversation between two agents"),
+    "run-group-chat": (run_group_chat_command, _add_run_group_chat_args, "Run a group chat with multiple agents"),
+}
+
 def main():
     """Main entry point for the CLI."""
     # Create the top-level parser
     parser = argparse.ArgumentParser(description="Autogen Agents Framework CLI")
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
     
-    # Create the parser for the "create-agent" command
-    create_agent_parser = subparsers.add_parser("create-agent", help="Create an agent")
-    create_agent_parser.add_argument("--type", "-t", required=True, choices=["assistant", "user_proxy", "specialized"], help="Type of agent to create")
-    create_agent_parser.add_argument("--name", "-n", required=True, help="Name of the agent")
-    create_agent_parser.add_argument("--description", "-d", default="", help="Description of the agent")
-    create_agent_parser.add_argument("--system-message", "-s", required=True, help="System message for the agent")
-    create_agent_parser.add_argument("--human-input-mode", choices=["ALWAYS", "NEVER", "TERMINATE"], default="NEVER", help="Human input mode")
-    create_agent_parser.add_argument("--save-config", help="Path to save the configuration")
-    
-    # Create the parser for the "run-conversation" command
-    run_conversation_parser = subparsers.add_parser("run-conversation", help="Run a conversation between two agents")
-    run_conversation_parser.add_argument("--config", "-c", help="Path to a configuration file")
-    run_conversation_parser.add_argument("--assistant-name", default="Assistant", help="Name of the assistant agent")
-    run_conversation_parser.add_argument("--assistant-system-message", default="You are a helpful AI assistant.", help="System message for the assistant agent")
-    run_conversation_parser.add_argument("--user-name", default="User", help="Name of the user proxy agent")
-    run_conversation_parser.add_argument("--human-input-mode", choices=["ALWAYS", "NEVER", "TERMINATE"], default="ALWAYS", help="Human input mode")
-    run_conversation_parser.add_argument("--use-docker", action="store_true", help="Use Docker for code execution")
-    run_conversation_parser.add_argument("--memory", action="store_true", help="Enable memory persistence")
-    run_conversation_parser.add_argument("--message", "-m", required=True, help="Initial message to start the conversation")
-    
-    # Create the parser for the "run-group-chat" command
-    run_group_chat_parser = subparsers.add_parser("run-group-chat", help="Run a group chat with multiple agents")
-    run_group_chat_parser.add_argument("--config", "-c", help="Path to a configuration file")
-    run_group_chat_parser.add_argument("--specialized", action="store_true", help="Include specialized agents in the group chat")
-    run_group_chat_parser.add_argument("--user-name", default="User", help="Name of the user proxy agent")
-    run_group_chat_parser.add_argument("--human-input-mode", choices=["ALWAYS", "NEVER", "TERMINATE"], default="ALWAYS", help="Human input mode")
-    run_group_chat_parser.add_argument("--use-docker", action="store_true", help="Use Docker for code execution")
-    run_group_chat_parser.add_argument("--memory", action="store_true", help="Enable memory persistence")
-    run_group_chat_parser.add_argument("--max-round", type=int, default=10, help="Maximum number of rounds for the group chat")
-    run_group_chat_parser.add_argument("--message", "-m", required=True, help="Initial message to start the group chat")
-    
-    # Parse the arguments
-    args = parser.parse_args()
-    
-    # Execute the appropriate command
-    if args.command == "create-agent":
-        create_agent_command(args)
-    elif args.command == "run-conversation":
-        run_conversation_command(args)
-    elif args.command == "run-group-chat":
-        run_group_chat_command(args)
-    else:
+    # Register the commands; their arguments are only added once the command is chosen
+    for command, (_, _, help_text) in COMMANDS.items():
+        subparsers.add_parser(command, help=help_text, add_help=False)
+    
+    # Find the chosen command, then add its arguments and parse them in full
+    args, _ = parser.parse_known_args()
+    if args.command is None:
         parser.print_help()
+        return
+    
+    handler, add_args, _ = COMMANDS[args.command]
+    command_parser = subparsers.choices[args.command]
+    command_parser.add_argument("-h", "--help", action="help", help="show this help message and exit")
+    add_args(command_parser)
+    
+    # Execute the command
+    handler(parser.parse_args())
 
 if __name__ == "__main__":
     main()
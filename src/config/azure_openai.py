@@ -2,6 +2,7 @@
 Azure OpenAI integration for the Autogen Agents Framework.
 """
 
+import functools
 from typing import Dict, Any, Optional
 from .config_manager import AzureOpenAIConfig
 
@@ -22,14 +23,30 @@ def create_azure_openai_config(config: AzureOpenAIConfig) -> Dict[str, Any]:
                 "api_key": config.api_key,
                 "api_type": "azure", 
                 "api_version": config.api_version,
-                "base_url": config.endpoint,
-                "api_key": config.api_key
+                "base_url": config.endpoint
             }
         ],
         "temperature": 0.7,
         "cache_seed": None,  # Change this to an integer to enable caching
     }
 
+@functools.lru_cache(maxsize=32)
+def _cached_llm_config(
+    config: AzureOpenAIConfig,
+    temperature: float,
+    cache_seed: Optional[int],
+    max_tokens: Optional[int]
+) -> Dict[str, Any]:
+    """Build the LLM configuration once per distinct set of arguments."""
+    llm_config = create_azure_openai_config(config)
+    llm_config["temperature"] = temperature
+    llm_config["cache_seed"] = cache_seed
+    
+    if max_tokens is not None:
+        llm_config["config_list"][0]["max_tokens"] = max_tokens
+    
+    return llm_config
+
 def create_llm_config(
     config: AzureOpenAIConfig,
     temperature: float = 0.7,
@@ -50,12 +67,10 @@ def create_llm_config(
     Returns:
         LLM configuration dictionary for Autogen
     """
-    llm_config = create_azure_openai_config(config)
-    llm_config["temperature"] = temperature
-    llm_config["cache_seed"] = cache_seed
+    cached = _cached_llm_config(config, temperature, cache_seed, max_tokens)
     
-    if max_tokens is not None:
-        llm_config["config_list"][0]["max_tokens"] = max_tokens
+    # Return a fresh copy so callers can modify it without touching the cache
+    llm_config = {**cached, "config_list": [dict(entry) for entry in cached["config_list"]]}
     
     if functions is not None:
         llm_config["functions"] = functions
@@ -5,89 +5,230 @@ Handles loading and validating configuration from environment variables and conf
 
 import os
 import json
-from typing import Dict, Any, Optional
-from dotenv import load_dotenv
-from pydantic import BaseModel, Field, validator
+from typing import Dict, Any, Optional, Tuple, Union, get_args, get_origin
+from dataclasses import MISSING, asdict, dataclass, field, fields
+from pathlib import Path
+from ..bootstrap import load_env_once
 
-class AzureOpenAIConfig(BaseModel):
-    """Configuration for Azure OpenAI API."""
-    api_key: str = Field(..., description="Azure OpenAI API key")
-    endpoint: str = Field(..., description="Azure OpenAI endpoint URL")
-    api_version: str = Field("2023-05-15", description="Azure OpenAI API version")
-    deployment_name: str = Field(..., description="Azure OpenAI deployment name")
+# Use orjson to read and write config files when it is installed
+try:
+    import orjson
+    _loads = orjson.loads
+    
+    def _dumps(data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+    
+    def _dumps(data: Dict[str, Any]) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
+def _field_types(annotation: Any) -> Tuple[type, ...]:
+    """
+    Get the runtime types accepted for a dataclass field annotation.
+    
+    Args:
+        annotation: Field annotation, e.g. str, Optional[str] or Dict[str, Any]
+        
+    Returns:
+        Tuple of types usable with isinstance
+    """
+    if get_origin(annotation) is Union:
+        return tuple(get_origin(arg) or arg for arg in get_args(annotation))
+    return (get_origin(annotation) or annotation,)
+
+def _build_section(cls: type, data: Any, section: str) -> Any:
+    """
+    Create a configuration dataclass from a dictionary, ignoring unknown keys.
+    
+    Args:
+        cls: Configuration dataclass to create
+        data: Dictionary with the field values
+        section: Name of the section in the configuration, used in error messages
+        
+    Returns:
+        The configuration object
+        
+    Raises:
+        ValueError: If the section isn't a dictionary, or a required field is missing or has the wrong type
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"Config section {section} must be an object")
+    
+    values = {}
+    for config_field in fields(cls):
+        if config_field.name not in data:
+            if config_field.default is MISSING and config_field.default_factory is MISSING:
+                raise ValueError(f"Missing required config field: {section}.{config_field.name}")
+            continue
+        
+        value = data[config_field.name]
+        expected = _field_types(config_field.type)
+        if not isinstance(value, expected):
+            names = " or ".join("null" if t is type(None) else t.__name__ for t in expected)
+            raise ValueError(f"Config field {section}.{config_field.name} must be {names}, got {type(value).__name__}")
+        values[config_field.name] = value
+    return cls(**values)
 
-    @validator("endpoint")
-    def validate_endpoint(cls, v):
-        if not v.startswith(("http://", "https://")):
+def _build_sections(cls: type, data: Any, section: str) -> Dict[str, Any]:
+    """
+    Create a dictionary of configuration dataclasses from a dictionary of entries.
+    
+    Args:
+        cls: Configuration dataclass to create for each entry
+        data: Dictionary mapping entry names to their field values (None for no entries)
+        section: Name of the section in the configuration, used in error messages
+        
+    Returns:
+        Dictionary mapping entry names to configuration objects
+    """
+    if data is None:
+        return {}
+    if not isinstance(data, dict):
+        raise ValueError(f"Config section {section} must be an object")
+    return {name: _build_section(cls, entry, f"{section}.{name}") for name, entry in data.items()}
+
+@dataclass(frozen=True)
+class AzureOpenAIConfig:
+    """Configuration for Azure OpenAI API."""
+    # Frozen so instances are hashable and can key the LLM config cache
+    api_key: str
+    endpoint: str
+    deployment_name: str
+    api_version: str = "2023-05-15"
+    
+    def __post_init__(self):
+        if not self.endpoint.startswith(("http://", "https://")):
             raise ValueError("Endpoint must start with http:// or https://")
-        return v
 
-class AgentConfig(BaseModel):
+@dataclass
+class AgentConfig:
     """Configuration for an agent."""
-    name: str = Field(..., description="Agent name")
-    description: str = Field(..., description="Agent description")
-    system_message: str = Field(..., description="Agent system message")
-    llm_config: Dict[str, Any] = Field(..., description="LLM configuration for the agent")
+    name: str
+    description: str
+    system_message: str
+    llm_config: Dict[str, Any]
     
-class ToolConfig(BaseModel):
+@dataclass
+class ToolConfig:
     """Configuration for a tool."""
-    name: str = Field(..., description="Tool name")
-    description: str = Field(..., description="Tool description")
-    parameters: Dict[str, Any] = Field(default_factory=dict, description="Tool parameters")
+    name: str
+    description: str
+    parameters: Dict[str, Any] = field(default_factory=dict)
 
-class MCPServerConfig(BaseModel):
+@dataclass
+class MCPServerConfig:
     """Configuration for an MCP server."""
-    name: str = Field(..., description="MCP server name")
-    endpoint: str = Field(..., description="MCP server endpoint URL")
-    api_key: Optional[str] = Field(None, description="MCP server API key if required")
+    name: str
+    endpoint: str
+    api_key: Optional[str] = None
 
-class Config(BaseModel):
+@dataclass
+class Config:
     """Main configuration for the Autogen Agents Framework."""
     azure_openai: AzureOpenAIConfig
-    agents: Dict[str, AgentConfig] = Field(default_factory=dict)
-    tools: Dict[str, ToolConfig] = Field(default_factory=dict)
-    mcp_servers: Dict[str, MCPServerConfig] = Field(default_factory=dict)
+    agents: Dict[str, AgentConfig] = field(default_factory=dict)
+    tools: Dict[str, ToolConfig] = field(default_factory=dict)
+    mcp_servers: Dict[str, MCPServerConfig] = field(default_factory=dict)
+    
+    @classmethod
+    def _from_dict(cls, data: Dict[str, Any]) -> "Config":
+        """
+        Create a configuration from its dictionary form, as stored in a config file.
+        
+        Args:
+            data: Configuration dictionary
+            
+        Returns:
+            The configuration
+            
+        Raises:
+            ValueError: If a required section or field is missing or has the wrong type
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Configuration must be an object")
+        if "azure_openai" not in data:
+            raise ValueError("Missing required config section: azure_openai")
+        
+        # Unknown keys are ignored, as they were with the previous pydantic models
+        return cls(
+            azure_openai=_build_section(AzureOpenAIConfig, data["azure_openai"], "azure_openai"),
+            agents=_build_sections(AgentConfig, data.get("agents"), "agents"),
+            tools=_build_sections(ToolConfig, data.get("tools"), "tools"),
+            mcp_servers=_build_sections(MCPServerConfig, data.get("mcp_servers"), "mcp_servers"),
+        )
+    
+    def dict(self) -> Dict[str, Any]:
+        """Convert the configuration to a dictionary."""
+        return asdict(self)
 
 class ConfigManager:
     """Manager for loading and accessing configuration."""
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, load_env: bool = True):
         """
         Initialize the configuration manager.
         
         Args:
             config_path: Path to a JSON configuration file. If None, will try to load from environment variables.
+            load_env: Whether to load the .env file first (False if the caller already loaded it)
         """
         self.config = None
-        self._load_config(config_path)
+        self._load_config(config_path, load_env)
     
-    def _load_config(self, config_path: Optional[str] = None):
+    def _load_config(self, config_path: Optional[str] = None, load_env: bool = True):
         """
         Load configuration from file or environment variables.
         
         Args:
             config_path: Path to a JSON configuration file.
+            load_env: Whether to load the .env file first.
         """
         # Load environment variables
-        load_dotenv()
+        if load_env:
+            load_env_once()
+        
+        # Fall back to environment variables when no config file is found
+        config = self._load_file_config(config_path) if config_path else None
+        if config is None:
+            config = self._load_env_config()
         
-        if config_path and os.path.exists(config_path):
-            # Load from config file
-            with open(config_path, 'r') as f:
-                config_data = json.load(f)
-        else:
-            # Load from environment variables
-            config_data = {
-                "azure_openai": {
-                    "api_key": os.getenv("AZURE_OPENAI_API_KEY", ""),
-                    "endpoint": os.getenv("AZURE_OPENAI_ENDPOINT", ""),
-                    "api_version": os.getenv("AZURE_OPENAI_API_VERSION", "2023-05-15"),
-                    "deployment_name": os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "")
-                }
+        self.config = config
+    
+    def _load_file_config(self, config_path: str) -> Optional[Config]:
+        """
+        Load configuration from a file.
+        
+        Args:
+            config_path: Path to a JSON configuration file.
+            
+        Returns:
+            The configuration, or None if the file doesn't exist
+        """
+        try:
+            config_data = _loads(Path(config_path).read_bytes())
+        except FileNotFoundError:
+            return None
+        return Config._from_dict(config_data)
+    
+    def _load_env_config(self) -> Config:
+        """
+        Load configuration from environment variables.
+        
+        Returns:
+            The configuration
+        """
+        config_data = {
+            "azure_openai": {
+                "api_key": os.getenv("AZURE_OPENAI_API_KEY", ""),
+                "endpoint": os.getenv("AZURE_OPENAI_ENDPOINT", ""),
+                "api_version": os.getenv("AZURE_OPENAI_API_VERSION", "2023-05-15"),
+                "deployment_name": os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "")
             }
+        }
         
         # Validate and create config object
-        self.config = Config(**config_data)
+        return Config._from_dict(config_data)
     
     def get_azure_openai_config(self) -> AzureOpenAIConfig:
         """Get Azure OpenAI configuration."""
@@ -112,5 +253,4 @@ class ConfigManager:
         Args:
             config_path: Path to save the configuration file.
         """
-        with open(config_path, 'w') as f:
-            json.dump(self.config.dict(), f, indent=2)
+        Path(config_path).write_bytes(_dumps(self.config.dict()))
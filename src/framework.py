@@ -2,16 +2,20 @@
 Main framework module for the Autogen Agents Framework.
 """
 
+from __future__ import annotations
+
 import os
-from typing import Dict, Any, List, Optional, Union, Type
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple, Union, Type
 from .config.config_manager import ConfigManager, AgentConfig, ToolConfig, MCPServerConfig
 from .config.azure_openai import create_llm_config
 from .agents.base_agent import BaseAgent
-from .agents.assistant_agent import AssistantAgent
-from .agents.user_proxy_agent import UserProxyAgent
-from .tools.tool_registry import ToolRegistry
-from .tools.basic_tools import register_basic_tools
-from .mcp.mcp_client import MCPManager
+
+if TYPE_CHECKING:
+    from .tools.tool_registry import ToolRegistry
+    from .mcp.mcp_client import MCPManager
+
+# Basic tool dictionaries, collected once and loaded into every framework's registry
+_BASIC_TOOL_DICTS: Optional[Tuple[Dict[str, Any], ...]] = None
 
 class AgentFramework:
     """
@@ -19,20 +23,49 @@ class AgentFramework:
     This class manages agents, tools, and MCP servers.
     """
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, load_env: bool = True):
         """
         Initialize the agent framework.
         
         Args:
             config_path: Path to a JSON configuration file. If None, will try to load from environment variables.
+            load_env: Whether to load the .env file first (False if the caller already loaded it)
         """
-        self.config_manager = ConfigManager(config_path)
-        self.tool_registry = ToolRegistry()
-        self.mcp_manager = MCPManager()
+        self.config_manager = ConfigManager(config_path, load_env=load_env)
         self.agents: Dict[str, BaseAgent] = {}
         
-        # Register basic tools
-        register_basic_tools(self.tool_registry)
+        # The tool registry and MCP manager are created on first use
+        self._tool_registry: Optional[ToolRegistry] = None
+        self._mcp_manager: Optional[MCPManager] = None
+    
+    @property
+    def tool_registry(self) -> ToolRegistry:
+        """Tool registry, created with the basic tools registered on first access."""
+        if self._tool_registry is None:
+            global _BASIC_TOOL_DICTS
+            from .tools.tool_registry import ToolRegistry
+            
+            # Run the basic tool registration only for the first framework
+            if _BASIC_TOOL_DICTS is None:
+                from .tools.basic_tools import register_basic_tools
+                
+                basic_registry = ToolRegistry()
+                register_basic_tools(basic_registry)
+                _BASIC_TOOL_DICTS = basic_registry.get_tool_dicts()
+            
+            tool_registry = ToolRegistry()
+            tool_registry.register_functions(_BASIC_TOOL_DICTS)
+            self._tool_registry = tool_registry
+        return self._tool_registry
+    
+    @property
+    def mcp_manager(self) -> MCPManager:
+        """MCP manager, created on first access."""
+        if self._mcp_manager is None:
+            from .mcp.mcp_client import MCPManager
+            
+            self._mcp_manager = MCPManager()
+        return self._mcp_manager
     
     def create_agent(
         self,
@@ -61,22 +94,96 @@ class AgentFramework:
         Returns:
             The created agent
         """
-        # Use Azure OpenAI configuration if llm_config is not provided
-        if llm_config is None and agent_type != "user_proxy":
-            azure_config = self.config_manager.get_azure_openai_config()
-            llm_config = create_llm_config(azure_config)
-        
         # Get tools from registry if not provided
         if tools is None:
             tools = self.tool_registry.get_tool_dicts()
         
-        # Add MCP tools
-        mcp_tools = self.mcp_manager.create_autogen_tools()
-        if mcp_tools:
-            tools = tools + mcp_tools
+        return self._build_agent(
+            agent_type=agent_type,
+            name=name,
+            description=description,
+            system_message=system_message,
+            llm_config=llm_config,
+            tools=self._with_mcp_tools(tools),
+            human_input_mode=human_input_mode,
+            code_execution_config=code_execution_config,
+        )
+    
+    def create_agents_batch(
+        self,
+        specs: List[Dict[str, Any]],
+        shared_tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[BaseAgent]:
+        """
+        Create several agents that share the same tools.
+        
+        The tool list, including MCP tools, is resolved once and reused for every agent.
+        
+        Args:
+            specs: Keyword arguments for each agent, as accepted by create_agent (without tools)
+            shared_tools: List of tools available to all the agents (None for the registered tools)
+            
+        Returns:
+            The created agents, in the order of the specs
+        """
+        if shared_tools is None:
+            shared_tools = self.tool_registry.get_tool_dicts()
+        tools = self._with_mcp_tools(shared_tools)
+        
+        return [self._build_agent(tools=tools, **spec) for spec in specs]
+    
+    def _with_mcp_tools(self, tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Add the tools of all registered MCP servers to a tool list.
+        
+        Args:
+            tools: List of tools
+            
+        Returns:
+            The tools followed by the MCP tools
+        """
+        # Nothing to add while no MCP server is registered
+        if self._mcp_manager is None or not self._mcp_manager.has_clients():
+            return tools
+        
+        return [*tools, *self._mcp_manager.create_autogen_tools()]
+    
+    def _build_agent(
+        self,
+        agent_type: str,
+        name: str,
+        description: str,
+        system_message: str,
+        tools: List[Dict[str, Any]],
+        llm_config: Optional[Dict[str, Any]] = None,
+        human_input_mode: str = "NEVER",
+        code_execution_config: Optional[Dict[str, Any]] = None,
+    ) -> BaseAgent:
+        """
+        Construct and register an agent with an already resolved tool list.
+        
+        Args:
+            agent_type: Type of agent ("assistant" or "user_proxy")
+            name: Name of the agent
+            description: Description of the agent
+            system_message: System message for the agent
+            tools: List of tools available to the agent
+            llm_config: LLM configuration for the agent
+            human_input_mode: Mode for human input ("ALWAYS", "NEVER", or "TERMINATE")
+            code_execution_config: Configuration for code execution (only for user_proxy)
+            
+        Returns:
+            The created agent
+        """
+        # Use Azure OpenAI configuration if llm_config is not provided
+        if llm_config is None and agent_type != "user_proxy":
+            azure_config = self.config_manager.get_azure_openai_config()
+            llm_config = create_llm_config(azure_config)
         
         # Create the agent based on type
         if agent_type == "assistant":
+            from .agents.assistant_agent import AssistantAgent
+            
             agent = AssistantAgent(
                 name=name,
                 description=description,
@@ -86,6 +193,8 @@ class AgentFramework:
                 human_input_mode=human_input_mode,
             )
         elif agent_type == "user_proxy":
+            from .agents.user_proxy_agent import UserProxyAgent
+            
             agent = UserProxyAgent(
                 name=name,
                 description=description,
@@ -114,6 +223,24 @@ class AgentFramework:
         """
         return self.agents.get(name)
     
+    def _resolve_agent(self, agent: Union[str, BaseAgent]) -> BaseAgent:
+        """
+        Get an agent object from an agent name or object.
+        
+        Args:
+            agent: Agent name or agent object
+            
+        Returns:
+            The agent object
+        """
+        if not isinstance(agent, str):
+            return agent
+        
+        resolved = self.agents.get(agent)
+        if resolved is None:
+            raise ValueError(f"Agent not found: {agent}")
+        return resolved
+    
     def register_tool(
         self,
         name: str,
@@ -137,6 +264,16 @@ class AgentFramework:
             parameters=parameters
         )
     
+    def register_tools(self, tools: List[Dict[str, Any]]) -> None:
+        """
+        Register several tools at once.
+        
+        Args:
+            tools: List of dictionaries with name, description, function and optional
+                parameters keys, matching the arguments of register_tool
+        """
+        self.tool_registry.register_functions(tools)
+    
     def register_mcp_server(
         self,
         name: str,
@@ -163,7 +300,7 @@ class AgentFramework:
         sender: Union[str, BaseAgent],
         receiver: Union[str, BaseAgent],
         message: str
-    ) -> None:
+    ) -> Optional[Dict[str, Any]]:
         """
         Start a conversation between two agents.
         
@@ -171,20 +308,51 @@ class AgentFramework:
             sender: Sender agent name or agent object
             receiver: Receiver agent name or agent object
             message: Initial message
+            
+        Returns:
+            The receiver's last reply in the conversation, or None if it didn't reply
         """
         # Get agent objects if names were provided
-        if isinstance(sender, str):
-            sender = self.get_agent(sender)
-            if sender is None:
-                raise ValueError(f"Agent not found: {sender}")
-        
-        if isinstance(receiver, str):
-            receiver = self.get_agent(receiver)
-            if receiver is None:
-                raise ValueError(f"Agent not found: {receiver}")
+        sender = self._resolve_agent(sender)
+        receiver = self._resolve_agent(receiver)
         
         # Start the conversation
         sender.initiate_chat(receiver, message)
+        
+        # Take the reply straight from the receiver's chat history; messages it sent have the assistant role
+        history = receiver.agent.chat_messages.get(sender.agent, [])
+        for reply in reversed(history):
+            if reply.get("role") == "assistant" and reply.get("content"):
+                return reply
+        return None
+    
+    async def initiate_chat_async(
+        self,
+        sender: Union[str, BaseAgent],
+        receiver: Union[str, BaseAgent],
+        message: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Start a conversation between two agents without blocking the event loop.
+        
+        The blocking chat runs in the default executor, so independent conversations
+        can be awaited together with asyncio.gather and their LLM round-trips overlap.
+        
+        Conversations awaited together must not share an agent: Autogen agents are not
+        thread-safe, so give each concurrent conversation its own sender and receiver.
+        
+        Args:
+            sender: Sender agent name or agent object
+            receiver: Receiver agent name or agent object
+            message: Initial message
+            
+        Returns:
+            The receiver's last reply in the conversation, or None if it didn't reply
+        """
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.start_conversation, sender, receiver, message)
     
     def save_config(self, config_path: str) -> None:
         """
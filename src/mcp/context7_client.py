@@ -4,18 +4,37 @@ Context7 MCP client implementation for the Autogen Agents Framework.
 
 import requests
 import json
-from typing import Dict, Any, Optional, List
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Optional, List, Tuple
 from ..config.config_manager import MCPServerConfig
 
+# Use orjson to parse responses when it is installed; documentation payloads can be large
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 class Context7Client:
     """Client for interacting with the Context7 MCP server."""
     
-    def __init__(self, config: MCPServerConfig):
+    def __init__(
+        self,
+        config: MCPServerConfig,
+        cache_size: int = 128,
+        session: Optional[requests.Session] = None,
+        cache_ttl: Optional[float] = None
+    ):
         """
         Initialize a Context7 client.
         
         Args:
             config: MCP server configuration
+            cache_size: Maximum number of responses kept in the in-memory cache (0 to disable)
+            session: HTTP session to send requests with, so connections are kept alive
+                between calls (a new session is created if not provided)
+            cache_ttl: Seconds a cached response stays valid (None to keep it until evicted)
         """
         self.name = config.name
         self.endpoint = config.endpoint
@@ -25,6 +44,44 @@ class Context7Client:
         }
         if self.api_key:
             self.headers["Authorization"] = f"Bearer {self.api_key}"
+        self.session = session or requests.Session()
+        
+        # Raw response bodies and their expiry times keyed by request, least recently used first
+        self._cache: "OrderedDict[Tuple[Any, ...], Tuple[float, bytes]]" = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_ttl = cache_ttl
+    
+    def clear_cache(self) -> None:
+        """Discard all cached responses."""
+        self._cache.clear()
+    
+    def _cached(self, key: Tuple[Any, ...], fetch: Callable[[], bytes]) -> Dict[str, Any]:
+        """
+        Return a cached response, fetching and caching it on a miss.
+        
+        The raw response body is cached and decoded on every call, so each caller
+        gets its own copy that it can change freely.
+        
+        Args:
+            key: Cache key identifying the request
+            fetch: Function performing the request and returning the response body
+            
+        Returns:
+            Decoded JSON response
+        """
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._cache.move_to_end(key)
+            return _loads(entry[1])
+        
+        payload = fetch()
+        if self._cache_size > 0:
+            expires = time.monotonic() + self._cache_ttl if self._cache_ttl is not None else float("inf")
+            self._cache[key] = (expires, payload)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return _loads(payload)
     
     def resolve_library_id(self, library_name: str) -> Dict[str, Any]:
         """
@@ -34,14 +91,13 @@ class Context7Client:
             library_name: Library name to resolve
             
         Returns:
-            Dictionary containing resolved library IDs and metadata
+            Dictionary containing resolved library IDs and metadata. Repeated lookups
+            are served from the client's cache.
         """
         url = f"{self.endpoint}/resolve-library-id"
         params = {"libraryName": library_name}
-            
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+        
+        return self._cached(("resolve-library-id", library_name), lambda: self._get(url, params))
     
     def get_library_docs(self, library_id: str, tokens: int = 10000, topic: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -53,7 +109,7 @@ class Context7Client:
             topic: Optional topic to focus documentation on
             
         Returns:
-            Library documentation
+            Library documentation. Repeated requests are served from the client's cache.
         """
         url = f"{self.endpoint}/get-library-docs"
         params = {
@@ -62,10 +118,23 @@ class Context7Client:
         }
         if topic:
             params["topic"] = topic
+        
+        return self._cached(("get-library-docs", library_id, tokens, topic), lambda: self._get(url, params))
+    
+    def _get(self, url: str, params: Dict[str, Any]) -> bytes:
+        """
+        Send a GET request to the Context7 MCP server.
+        
+        Args:
+            url: Request URL
+            params: Query parameters
             
-        response = requests.get(url, headers=self.headers, params=params)
+        Returns:
+            Raw JSON response body
+        """
+        response = self.session.get(url, headers=self.headers, params=params)
         response.raise_for_status()
-        return response.json()
+        return response.content
     
     def create_autogen_tools(self) -> List[Dict[str, Any]]:
         """
@@ -10,12 +10,14 @@ from ..config.config_manager import MCPServerConfig
 class MCPClient:
     """Client for interacting with MCP servers."""
     
-    def __init__(self, config: MCPServerConfig):
+    def __init__(self, config: MCPServerConfig, session: Optional[requests.Session] = None):
         """
         Initialize an MCP client.
         
         Args:
             config: MCP server configuration
+            session: HTTP session to send requests with, so connections are kept alive
+                between calls (a new session is created if not provided)
         """
         self.name = config.name
         self.endpoint = config.endpoint
@@ -25,6 +27,7 @@ class MCPClient:
         }
         if self.api_key:
             self.headers["Authorization"] = f"Bearer {self.api_key}"
+        self.session = session or requests.Session()
     
     def list_resources(self, cursor: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -41,7 +44,7 @@ class MCPClient:
         if cursor:
             params["cursor"] = cursor
             
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.session.get(url, headers=self.headers, params=params)
         response.raise_for_status()
         return response.json()
     
@@ -58,7 +61,7 @@ class MCPClient:
         url = f"{self.endpoint}/resource"
         params = {"uri": uri}
             
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.session.get(url, headers=self.headers, params=params)
         response.raise_for_status()
         return response.json()
     
@@ -82,7 +85,7 @@ class MCPClient:
         if topic:
             params["topic"] = topic
             
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.session.get(url, headers=self.headers, params=params)
         response.raise_for_status()
         return response.json()
     
@@ -99,7 +102,7 @@ class MCPClient:
         url = f"{self.endpoint}/library/resolve"
         params = {"libraryName": library_name}
             
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.session.get(url, headers=self.headers, params=params)
         response.raise_for_status()
         return response.json()
     
@@ -157,9 +160,20 @@ class MCPClient:
 class MCPManager:
     """Manager for MCP clients."""
     
-    def __init__(self):
-        """Initialize an MCP manager."""
+    def __init__(self, pool_size: int = 32):
+        """
+        Initialize an MCP manager.
+        
+        Args:
+            pool_size: Maximum number of keep-alive connections kept per host
+        """
         self.clients: Dict[str, MCPClient] = {}
+        
+        # One HTTP session shared by all clients, so connections are reused across calls
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
     
     def register_client(self, config: MCPServerConfig) -> MCPClient:
         """
@@ -171,7 +185,7 @@ class MCPManager:
         Returns:
             The registered MCP client
         """
-        client = MCPClient(config)
+        client = MCPClient(config, session=self.session)
         self.clients[config.name] = client
         return client
     
@@ -196,6 +210,15 @@ class MCPManager:
         """
         return list(self.clients.values())
     
+    def has_clients(self) -> bool:
+        """
+        Check whether any MCP client is registered.
+        
+        Returns:
+            True if at least one client is registered
+        """
+        return bool(self.clients)
+    
     def create_autogen_tools(self) -> List[Dict[str, Any]]:
         """
         Create Autogen-compatible tool definitions for all registered MCP clients.
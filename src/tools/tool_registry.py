@@ -2,7 +2,8 @@
 Tool registry for the Autogen Agents Framework.
 """
 
-from typing import Dict, Any, List, Callable, Optional
+import sys
+from typing import Dict, Any, List, Callable, Optional, Tuple
 from ..config.config_manager import ToolConfig
 
 class Tool:
@@ -24,7 +25,8 @@ class Tool:
             function: Function implementing the tool
             parameters: Tool parameters schema
         """
-        self.name = name
+        # Intern the name; it is used as a key in the registry and in agent function maps
+        self.name = sys.intern(name)
         self.description = description
         self.function = function
         self.parameters = parameters or {}
@@ -69,6 +71,7 @@ class ToolRegistry:
     def __init__(self):
         """Initialize a tool registry."""
         self.tools: Dict[str, Tool] = {}
+        self._tool_dicts: Optional[Tuple[Dict[str, Any], ...]] = None
     
     def register_tool(self, tool: Tool) -> None:
         """
@@ -78,6 +81,7 @@ class ToolRegistry:
             tool: Tool to register
         """
         self.tools[tool.name] = tool
+        self._tool_dicts = None
     
     def register_function(
         self,
@@ -102,6 +106,25 @@ class ToolRegistry:
         self.register_tool(tool)
         return tool
     
+    def register_functions(self, specs: List[Dict[str, Any]]) -> List[Tool]:
+        """
+        Register several functions as tools at once.
+        
+        Args:
+            specs: List of dictionaries with name, description, function and optional
+                parameters keys, as accepted by register_function
+            
+        Returns:
+            The registered tools
+        """
+        tools = [
+            Tool(spec["name"], spec["description"], spec["function"], spec.get("parameters"))
+            for spec in specs
+        ]
+        self.tools.update((tool.name, tool) for tool in tools)
+        self._tool_dicts = None
+        return tools
+    
     def get_tool(self, name: str) -> Optional[Tool]:
         """
         Get a tool by name.
@@ -123,11 +146,16 @@ class ToolRegistry:
         """
         return list(self.tools.values())
     
-    def get_tool_dicts(self) -> List[Dict[str, Any]]:
+    def get_tool_dicts(self) -> Tuple[Dict[str, Any], ...]:
         """
         Get dictionary representations of all registered tools.
         
+        The result is built once and shared until another tool is registered,
+        so callers must copy it before modifying it.
+        
         Returns:
-            List of tool dictionaries
+            Tuple of tool dictionaries
         """
-        return [tool.to_dict() for tool in self.tools.values()]
+        if self._tool_dicts is None:
+            self._tool_dicts = tuple([tool.to_dict() for tool in self.tools.values()])
+        return self._tool_dicts
@@ -2,6 +2,7 @@
 Logging utilities for the Autogen Agents Framework.
 """
 
+import functools
 import logging
 import os
 import sys
@@ -31,9 +32,10 @@ def setup_logger(
     logger = logging.getLogger(name)
     logger.setLevel(level)
     
-    # Remove existing handlers to avoid duplicates
+    # Remove and close existing handlers to avoid duplicates and leaked log files
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+        handler.close()
     
     # Default format if not specified
     if log_format is None:
@@ -59,10 +61,14 @@ def setup_logger(
     
     return logger
 
+@functools.lru_cache(maxsize=None)
 def get_default_log_file() -> str:
     """
     Get the default log file path.
     
+    The path is created on the first call; later calls in the same process
+    return the same file.
+    
     Returns:
         Path to the default log file
     """
@@ -2,31 +2,214 @@
 Memory manager for the Autogen Agents Framework.
 """
 
+import hashlib
 import json
 import os
-from typing import Dict, Any, List, Optional, Union
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
 import sqlite3
 
+# Use orjson to parse memory content when it is installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+def new_conversation_id() -> str:
+    """
+    Generate a random conversation ID.
+    
+    Returns:
+        A 32-character hexadecimal string, the same shape as uuid.uuid4().hex
+    """
+    return os.urandom(16).hex()
+
 class MemoryManager:
     """
     Memory manager for storing and retrieving agent conversation history and knowledge.
     This class provides persistent storage for agent memories and conversation history.
     """
     
-    def __init__(self, db_path: str = "agent_memory.db"):
+    def __init__(self, db_path: str = "agent_memory.db", tuning: bool = True):
         """
         Initialize a memory manager.
         
         Args:
             db_path: Path to the SQLite database file
+            tuning: Whether to apply write-ahead logging and the other performance PRAGMAs
         """
         self.db_path = db_path
+        self.tuning = tuning
+        self._lock = threading.RLock()
+        self._transaction_depth = 0
+        self._transaction_thread: Optional[int] = None
+        self._conn = self._connect()
+        self._queue: Optional[queue.Queue] = None
+        self._writer: Optional[threading.Thread] = None
         self._initialize_db()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open the shared database connection with performance-oriented settings."""
+        conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA busy_timeout=5000")
+        
+        if self.tuning:
+            # Use write-ahead logging so readers don't block behind writers
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA cache_size=-20000")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+    
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run a block of statements in a single transaction on the shared connection.
+        
+        Other MemoryManager calls made inside the block from the same thread join the
+        transaction, so a batch of writes is committed together. This includes
+        add_message while the background writer is running: inside a transaction it
+        writes directly instead of queueing. Messages queued before the block are not
+        part of it, and flush() raises inside the block, since the writer cannot
+        write them until the transaction ends. Nested transactions use savepoints,
+        so a failing inner call only rolls back its own changes.
+        
+        Returns:
+            Context manager yielding the shared connection
+        """
+        with self._lock:
+            nested = self._transaction_depth > 0
+            self._conn.execute("SAVEPOINT nested" if nested else "BEGIN IMMEDIATE")
+            self._transaction_depth += 1
+            self._transaction_thread = threading.get_ident()
+            try:
+                yield self._conn
+            except BaseException:
+                if nested:
+                    self._conn.execute("ROLLBACK TO nested")
+                    self._conn.execute("RELEASE nested")
+                else:
+                    self._conn.execute("ROLLBACK")
+                raise
+            finally:
+                self._transaction_depth -= 1
+                if not nested:
+                    self._transaction_thread = None
+            self._conn.execute("RELEASE nested" if nested else "COMMIT")
+    
+    def _in_transaction(self) -> bool:
+        """Return whether the calling thread is inside a transaction() block."""
+        return self._transaction_depth > 0 and self._transaction_thread == threading.get_ident()
+    
+    def close(self) -> None:
+        """Stop the background writer, if running, and close the database connection."""
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+            self._queue = None
+        
+        with self._lock:
+            self._conn.close()
+    
+    def start_writer(self, batch_size: int = 32) -> None:
+        """
+        Start a background thread that writes messages added with add_message.
+        
+        While the writer is running, add_message only queues the message and returns
+        immediately; queued messages are written in batches. Call flush() before
+        reading messages back. Inside a transaction() block add_message still writes
+        directly, so the message is committed with the rest of the block.
+        
+        Args:
+            batch_size: Maximum number of queued messages written per transaction
+        """
+        if self._writer is not None:
+            return
+        
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._drain, args=(self._queue, batch_size), daemon=True)
+        self._writer.start()
+    
+    def flush(self) -> None:
+        """
+        Block until every message queued for the background writer is written.
+        
+        Raises:
+            RuntimeError: If called inside a transaction() block while the writer is
+                running, since the writer cannot write until the transaction ends
+        """
+        if self._queue is not None:
+            if self._in_transaction():
+                raise RuntimeError("flush() cannot be called inside a transaction")
+            self._queue.join()
+    
+    def _drain(self, pending: queue.Queue, batch_size: int) -> None:
+        """Write queued messages in batches until a None sentinel is received."""
+        while True:
+            items = [pending.get()]
+            while len(items) < batch_size:
+                try:
+                    items.append(pending.get_nowait())
+                except queue.Empty:
+                    break
+            
+            rows = [item for item in items if item is not None]
+            try:
+                if rows:
+                    with self.transaction() as conn:
+                        self._insert_messages(conn, rows)
+            except Exception as e:
+                print(f"Error writing queued messages: {e}")
+            finally:
+                for _ in items:
+                    pending.task_done()
+            
+            if len(rows) < len(items):
+                return
+    
+    def _insert_messages(self, conn: sqlite3.Connection, rows: List[Tuple[str, str, str, str, str]]) -> None:
+        """
+        Insert message rows, creating missing conversations and updating their timestamps.
+        
+        Args:
+            conn: Connection with an open transaction
+            rows: List of (conversation_id, sender, receiver, content, timestamp) tuples
+        """
+        # First and latest timestamp per conversation
+        first = {}
+        latest = {}
+        for conversation_id, _, _, _, timestamp in rows:
+            first.setdefault(conversation_id, timestamp)
+            latest[conversation_id] = timestamp
+        
+        # Create conversations that don't exist yet
+        conn.executemany(
+            "INSERT OR IGNORE INTO conversations (conversation_id, title, created_at, updated_at) VALUES (?, ?, ?, ?)",
+            [(conversation_id, f"Conversation {conversation_id}", timestamp, timestamp) for conversation_id, timestamp in first.items()]
+        )
+        
+        # Add all messages with one statement
+        conn.executemany(
+            "INSERT INTO messages (conversation_id, sender, receiver, content, timestamp) VALUES (?, ?, ?, ?, ?)",
+            rows
+        )
+        
+        # Update conversation timestamps
+        conn.executemany(
+            "UPDATE conversations SET updated_at = ? WHERE conversation_id = ?",
+            [(timestamp, conversation_id) for conversation_id, timestamp in latest.items()]
+        )
+    
     def _initialize_db(self):
         """Initialize the SQLite database with required tables."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         cursor = conn.cursor()
         
         # Create conversations table
@@ -53,6 +236,11 @@ class MemoryManager:
         )
         ''')
         
+        # Index messages by conversation so history queries avoid a scan and a sort
+        cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_msg_conv_ts ON messages (conversation_id, timestamp)
+        ''')
+        
         # Create memories table
         cursor.execute('''
         CREATE TABLE IF NOT EXISTS memories (
@@ -60,13 +248,144 @@ class MemoryManager:
             agent_name TEXT,
             memory_type TEXT,
             content TEXT,
+            content_hash TEXT,
             created_at TIMESTAMP,
             updated_at TIMESTAMP
         )
         ''')
         
-        conn.commit()
-        conn.close()
+        # Add the content hash column to databases created before content deduplication
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(memories)")}
+        if "content_hash" not in columns:
+            cursor.execute("ALTER TABLE memories ADD COLUMN content_hash TEXT")
+        
+        # Index memories by agent and type so retrieval doesn't scan the table
+        cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_mem_agent_type ON memories (agent_name, memory_type)
+        ''')
+        
+        # Create memory contents table, storing each distinct content once
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS memory_contents (
+            content_hash TEXT PRIMARY KEY,
+            content TEXT
+        )
+        ''')
+        
+        # Index memories by content hash so shared content can be found without a scan
+        cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_mem_content_hash ON memories (content_hash)
+        ''')
+        
+        # Remove stored content once no memory references it
+        orphan_sql = (
+            "DELETE FROM memory_contents WHERE content_hash = old.content_hash "
+            "AND NOT EXISTS (SELECT 1 FROM memories WHERE content_hash = old.content_hash)"
+        )
+        cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS memory_contents_delete AFTER DELETE ON memories
+        WHEN old.content_hash IS NOT NULL BEGIN
+            {orphan_sql};
+        END
+        ''')
+        cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS memory_contents_update AFTER UPDATE OF content_hash ON memories
+        WHEN old.content_hash IS NOT NULL AND old.content_hash IS NOT new.content_hash BEGIN
+            {orphan_sql};
+        END
+        ''')
+        
+        self._fts_enabled = self._initialize_fts(cursor)
+    
+    def _initialize_fts(self, cursor: sqlite3.Cursor) -> bool:
+        """
+        Create the full-text index used by search_memories, kept in sync by triggers.
+        
+        The index uses the trigram tokenizer so a search still matches any substring
+        of the content, like the LIKE scan it replaces.
+        
+        Args:
+            cursor: Cursor on the shared connection
+            
+        Returns:
+            True if the index is available, False if this SQLite build lacks FTS5 trigram support
+        """
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'memories_fts'"
+        ).fetchone() is not None
+        
+        try:
+            cursor.execute("CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(content, tokenize='trigram')")
+        except sqlite3.OperationalError:
+            return False
+        
+        # Index each memory under its id, resolving deduplicated content
+        content_sql = "COALESCE((SELECT content FROM memory_contents WHERE content_hash = new.content_hash), new.content)"
+        cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS memories_fts_insert AFTER INSERT ON memories BEGIN
+            INSERT INTO memories_fts (rowid, content) VALUES (new.id, {content_sql});
+        END
+        ''')
+        cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS memories_fts_delete AFTER DELETE ON memories BEGIN
+            DELETE FROM memories_fts WHERE rowid = old.id;
+        END
+        ''')
+        cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS memories_fts_update AFTER UPDATE OF content, content_hash ON memories BEGIN
+            DELETE FROM memories_fts WHERE rowid = old.id;
+            INSERT INTO memories_fts (rowid, content) VALUES (new.id, {content_sql});
+        END
+        ''')
+        
+        # Index memories stored before the index existed
+        if not exists:
+            cursor.execute(
+                "INSERT INTO memories_fts (rowid, content) "
+                "SELECT m.id, COALESCE(c.content, m.content) "
+                "FROM memories m LEFT JOIN memory_contents c ON c.content_hash = m.content_hash"
+            )
+        return True
+    
+    def _encode_content(self, content: Union[str, Dict[str, Any]]) -> Tuple[str, str]:
+        """
+        Serialize memory content and compute its content hash.
+        
+        Args:
+            content: Memory content (string or JSON-serializable object)
+            
+        Returns:
+            Tuple of (content_hash, serialized content)
+        """
+        # Normalize dictionaries so equal content always serializes the same way
+        if isinstance(content, dict):
+            content = json.dumps(content, sort_keys=True, separators=(",", ":"))
+        
+        content_hash = hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+        return content_hash, content
+    
+    def _insert_memories(self, conn: sqlite3.Connection, memories: List[Tuple[str, str, Union[str, Dict[str, Any]]]]) -> None:
+        """
+        Insert memories, storing each distinct content only once.
+        
+        Args:
+            conn: Connection with an open transaction
+            memories: List of (agent_name, memory_type, content) tuples
+        """
+        now = datetime.now().isoformat()
+        encoded = [
+            (agent_name, memory_type, *self._encode_content(content))
+            for agent_name, memory_type, content in memories
+        ]
+        
+        conn.executemany(
+            "INSERT OR IGNORE INTO memory_contents (content_hash, content) VALUES (?, ?)",
+            [(content_hash, content) for _, _, content_hash, content in encoded]
+        )
+        conn.executemany(
+            "INSERT INTO memories (agent_name, memory_type, content_hash, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+            [(agent_name, memory_type, content_hash, now, now) for agent_name, memory_type, content_hash, _ in encoded]
+        )
     
     def create_conversation(self, conversation_id: str, title: str) -> bool:
         """
@@ -80,17 +399,12 @@ class MemoryManager:
             True if successful, False otherwise
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
             now = datetime.now().isoformat()
-            cursor.execute(
-                "INSERT INTO conversations (conversation_id, title, created_at, updated_at) VALUES (?, ?, ?, ?)",
-                (conversation_id, title, now, now)
-            )
-            
-            conn.commit()
-            conn.close()
+            with self.transaction() as conn:
+                conn.execute(
+                    "INSERT INTO conversations (conversation_id, title, created_at, updated_at) VALUES (?, ?, ?, ?)",
+                    (conversation_id, title, now, now)
+                )
             return True
         except Exception as e:
             print(f"Error creating conversation: {e}")
@@ -109,36 +423,48 @@ class MemoryManager:
         Returns:
             True if successful, False otherwise
         """
+        row = (conversation_id, sender, receiver, content, datetime.now().isoformat())
+        
+        # Hand the message to the background writer if one is running,
+        # unless it belongs to the caller's open transaction
+        if self._queue is not None and not self._in_transaction():
+            self._queue.put(row)
+            return True
+        
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Check if conversation exists
-            cursor.execute("SELECT conversation_id FROM conversations WHERE conversation_id = ?", (conversation_id,))
-            if cursor.fetchone() is None:
-                # Create conversation if it doesn't exist
-                self.create_conversation(conversation_id, f"Conversation {conversation_id}")
-            
-            # Add message
-            now = datetime.now().isoformat()
-            cursor.execute(
-                "INSERT INTO messages (conversation_id, sender, receiver, content, timestamp) VALUES (?, ?, ?, ?, ?)",
-                (conversation_id, sender, receiver, content, now)
-            )
-            
-            # Update conversation timestamp
-            cursor.execute(
-                "UPDATE conversations SET updated_at = ? WHERE conversation_id = ?",
-                (now, conversation_id)
-            )
-            
-            conn.commit()
-            conn.close()
+            with self.transaction() as conn:
+                self._insert_messages(conn, [row])
             return True
         except Exception as e:
             print(f"Error adding message: {e}")
             return False
     
+    def add_messages_bulk(self, conversation_id: str, messages: List[Tuple[str, str, str]]) -> bool:
+        """
+        Add several messages to a conversation in a single transaction.
+        
+        Args:
+            conversation_id: Conversation identifier
+            messages: List of (sender, receiver, content) tuples, in conversation order
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not messages:
+            return True
+        
+        try:
+            rows = [
+                (conversation_id, sender, receiver, content, datetime.now().isoformat())
+                for sender, receiver, content in messages
+            ]
+            with self.transaction() as conn:
+                self._insert_messages(conn, rows)
+            return True
+        except Exception as e:
+            print(f"Error adding messages: {e}")
+            return False
+    
     def get_conversation_history(self, conversation_id: str) -> List[Dict[str, Any]]:
         """
         Get the history of a conversation.
@@ -150,29 +476,70 @@ class MemoryManager:
             List of messages in the conversation
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute(
-                "SELECT sender, receiver, content, timestamp FROM messages WHERE conversation_id = ? ORDER BY timestamp",
-                (conversation_id,)
-            )
-            
-            messages = []
-            for row in cursor.fetchall():
-                messages.append({
-                    "sender": row[0],
-                    "receiver": row[1],
-                    "content": row[2],
-                    "timestamp": row[3]
-                })
-            
-            conn.close()
-            return messages
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT sender, receiver, content, timestamp FROM messages WHERE conversation_id = ? ORDER BY timestamp, id",
+                    (conversation_id,)
+                ).fetchall()
+            return [dict(row) for row in rows]
         except Exception as e:
             print(f"Error getting conversation history: {e}")
             return []
     
+    def get_conversation_history_summary(self, conversation_id: str, content_chars: int = 100) -> List[Dict[str, Any]]:
+        """
+        Get the history of a conversation with message content truncated by SQLite.
+        
+        Args:
+            conversation_id: Conversation identifier
+            content_chars: Maximum number of content characters to return per message
+            
+        Returns:
+            List of messages in the conversation with truncated content
+        """
+        return list(self.iter_conversation_history(conversation_id, content_chars))
+    
+    def iter_conversation_history(
+        self,
+        conversation_id: str,
+        content_chars: int = 100,
+        batch_size: int = 256
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the history of a conversation with message content truncated by SQLite.
+        
+        Rows are fetched in batches, so only one batch is held in memory at a time.
+        
+        Args:
+            conversation_id: Conversation identifier
+            content_chars: Maximum number of content characters to return per message
+            batch_size: Number of rows fetched from SQLite at a time
+            
+        Returns:
+            Iterator over the messages in the conversation with truncated content
+        """
+        cursor = None
+        try:
+            with self._lock:
+                cursor = self._conn.execute(
+                    "SELECT sender, receiver, substr(content, 1, ?) AS content, timestamp FROM messages WHERE conversation_id = ? ORDER BY timestamp, id",
+                    (content_chars, conversation_id)
+                )
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(row)
+        except Exception as e:
+            print(f"Error streaming conversation history: {e}")
+        finally:
+            # Close the cursor even if the caller stops early, so it doesn't hold a read snapshot
+            if cursor is not None:
+                with self._lock:
+                    cursor.close()
+    
     def get_recent_conversations(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get recent conversations.
@@ -184,25 +551,12 @@ class MemoryManager:
             List of recent conversations
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute(
-                "SELECT conversation_id, title, created_at, updated_at FROM conversations ORDER BY updated_at DESC LIMIT ?",
-                (limit,)
-            )
-            
-            conversations = []
-            for row in cursor.fetchall():
-                conversations.append({
-                    "conversation_id": row[0],
-                    "title": row[1],
-                    "created_at": row[2],
-                    "updated_at": row[3]
-                })
-            
-            conn.close()
-            return conversations
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT conversation_id, title, created_at, updated_at FROM conversations ORDER BY updated_at DESC LIMIT ?",
+                    (limit,)
+                ).fetchall()
+            return [dict(row) for row in rows]
         except Exception as e:
             print(f"Error getting recent conversations: {e}")
             return []
@@ -220,26 +574,48 @@ class MemoryManager:
             True if successful, False otherwise
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Convert content to JSON string if it's a dictionary
-            if isinstance(content, dict):
-                content = json.dumps(content)
-            
-            now = datetime.now().isoformat()
-            cursor.execute(
-                "INSERT INTO memories (agent_name, memory_type, content, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
-                (agent_name, memory_type, content, now, now)
-            )
-            
-            conn.commit()
-            conn.close()
+            with self.transaction() as conn:
+                self._insert_memories(conn, [(agent_name, memory_type, content)])
             return True
         except Exception as e:
             print(f"Error storing memory: {e}")
             return False
     
+    def store_memories_bulk(self, memories: List[Tuple[str, str, Union[str, Dict[str, Any]]]]) -> bool:
+        """
+        Store several memories in a single transaction.
+        
+        Args:
+            memories: List of (agent_name, memory_type, content) tuples
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not memories:
+            return True
+        
+        try:
+            with self.transaction() as conn:
+                self._insert_memories(conn, memories)
+            return True
+        except Exception as e:
+            print(f"Error storing memories: {e}")
+            return False
+    
+    def _row_to_memory(self, row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a memory row to a dictionary, parsing JSON content where possible."""
+        memory = dict(row)
+        content = memory["content"]
+        
+        # Only dictionaries are stored as JSON, so skip parsing anything else
+        if isinstance(content, str) and content.startswith("{"):
+            try:
+                memory["content"] = _loads(content)
+            except ValueError:
+                # If not JSON, keep as string
+                pass
+        return memory
+    
     def retrieve_memories(self, agent_name: str, memory_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Retrieve memories for an agent.
@@ -252,44 +628,60 @@ class MemoryManager:
             List of memories
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            if memory_type:
-                cursor.execute(
-                    "SELECT id, memory_type, content, created_at, updated_at FROM memories WHERE agent_name = ? AND memory_type = ?",
-                    (agent_name, memory_type)
-                )
-            else:
-                cursor.execute(
-                    "SELECT id, memory_type, content, created_at, updated_at FROM memories WHERE agent_name = ?",
-                    (agent_name,)
-                )
-            
-            memories = []
-            for row in cursor.fetchall():
-                content = row[2]
-                try:
-                    # Try to parse content as JSON
-                    content = json.loads(content)
-                except:
-                    # If not JSON, keep as string
-                    pass
-                
-                memories.append({
-                    "id": row[0],
-                    "memory_type": row[1],
-                    "content": content,
-                    "created_at": row[3],
-                    "updated_at": row[4]
-                })
-            
-            conn.close()
-            return memories
+            with self._lock:
+                if memory_type:
+                    rows = self._conn.execute(
+                        "SELECT m.id, m.memory_type, COALESCE(c.content, m.content) AS content, m.created_at, m.updated_at "
+                        "FROM memories m LEFT JOIN memory_contents c ON c.content_hash = m.content_hash "
+                        "WHERE m.agent_name = ? AND m.memory_type = ?",
+                        (agent_name, memory_type)
+                    ).fetchall()
+                else:
+                    rows = self._conn.execute(
+                        "SELECT m.id, m.memory_type, COALESCE(c.content, m.content) AS content, m.created_at, m.updated_at "
+                        "FROM memories m LEFT JOIN memory_contents c ON c.content_hash = m.content_hash "
+                        "WHERE m.agent_name = ?",
+                        (agent_name,)
+                    ).fetchall()
+            
+            return [self._row_to_memory(row) for row in rows]
         except Exception as e:
             print(f"Error retrieving memories: {e}")
             return []
     
+    def retrieve_memories_multi(self, agent_names: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Retrieve memories for several agents with a single query.
+        
+        Args:
+            agent_names: Names of the agents
+            
+        Returns:
+            Dictionary mapping each agent name to its list of memories
+        """
+        memories_by_agent = {agent_name: [] for agent_name in agent_names}
+        if not memories_by_agent:
+            return memories_by_agent
+        
+        try:
+            placeholders = ", ".join("?" for _ in memories_by_agent)
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT m.agent_name, m.id, m.memory_type, COALESCE(c.content, m.content) AS content, m.created_at, m.updated_at "
+                    "FROM memories m LEFT JOIN memory_contents c ON c.content_hash = m.content_hash "
+                    f"WHERE m.agent_name IN ({placeholders}) ORDER BY m.id",
+                    tuple(memories_by_agent)
+                ).fetchall()
+            
+            for row in rows:
+                memory = self._row_to_memory(row)
+                memories_by_agent[memory.pop("agent_name")].append(memory)
+            
+            return memories_by_agent
+        except Exception as e:
+            print(f"Error retrieving memories: {e}")
+            return {agent_name: [] for agent_name in agent_names}
+    
     def update_memory(self, memory_id: int, content: Union[str, Dict[str, Any]]) -> bool:
         """
         Update an existing memory.
@@ -302,21 +694,18 @@ class MemoryManager:
             True if successful, False otherwise
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Convert content to JSON string if it's a dictionary
-            if isinstance(content, dict):
-                content = json.dumps(content)
+            content_hash, content = self._encode_content(content)
             
             now = datetime.now().isoformat()
-            cursor.execute(
-                "UPDATE memories SET content = ?, updated_at = ? WHERE id = ?",
-                (content, now, memory_id)
-            )
-            
-            conn.commit()
-            conn.close()
+            with self.transaction() as conn:
+                conn.execute(
+                    "INSERT OR IGNORE INTO memory_contents (content_hash, content) VALUES (?, ?)",
+                    (content_hash, content)
+                )
+                cursor = conn.execute(
+                    "UPDATE memories SET content = NULL, content_hash = ?, updated_at = ? WHERE id = ?",
+                    (content_hash, now, memory_id)
+                )
             return cursor.rowcount > 0
         except Exception as e:
             print(f"Error updating memory: {e}")
@@ -333,13 +722,8 @@ class MemoryManager:
             True if successful, False otherwise
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
-            
-            conn.commit()
-            conn.close()
+            with self._lock:
+                cursor = self._conn.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
             return cursor.rowcount > 0
         except Exception as e:
             print(f"Error deleting memory: {e}")
@@ -356,35 +740,23 @@ class MemoryManager:
             List of matching memories
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute(
-                "SELECT id, agent_name, memory_type, content, created_at, updated_at FROM memories WHERE content LIKE ?",
-                (f"%{query}%",)
+            select = (
+                "SELECT m.id, m.agent_name, m.memory_type, COALESCE(c.content, m.content) AS content, m.created_at, m.updated_at "
+                "FROM memories m LEFT JOIN memory_contents c ON c.content_hash = m.content_hash "
             )
             
-            memories = []
-            for row in cursor.fetchall():
-                content = row[3]
-                try:
-                    # Try to parse content as JSON
-                    content = json.loads(content)
-                except:
-                    # If not JSON, keep as string
-                    pass
-                
-                memories.append({
-                    "id": row[0],
-                    "agent_name": row[1],
-                    "memory_type": row[2],
-                    "content": content,
-                    "created_at": row[4],
-                    "updated_at": row[5]
-                })
+            # Trigrams can't match queries shorter than three characters, so scan for those
+            if self._fts_enabled and len(query) >= 3:
+                sql = select + "WHERE m.id IN (SELECT rowid FROM memories_fts WHERE memories_fts MATCH ?)"
+                params = ('"' + query.replace('"', '""') + '"',)
+            else:
+                sql = select + "WHERE COALESCE(c.content, m.content) LIKE ?"
+                params = (f"%{query}%",)
+            
+            with self._lock:
+                rows = self._conn.execute(sql, params).fetchall()
             
-            conn.close()
-            return memories
+            return [self._row_to_memory(row) for row in rows]
         except Exception as e:
             print(f"Error searching memories: {e}")
             return []
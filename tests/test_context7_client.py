@@ -4,7 +4,9 @@ Unit tests for the Context7 MCP client.
 
 import os
 import sys
+import json
 import unittest
+import requests
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 
@@ -12,6 +14,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from src.mcp.context7_client import Context7Client
+from src.mcp.mcp_client import MCPManager
 from src.config.config_manager import MCPServerConfig
 
 class TestContext7Client(unittest.TestCase):
@@ -34,16 +37,16 @@ class TestContext7Client(unittest.TestCase):
         self.assertEqual(self.client.headers["Content-Type"], "application/json")
         self.assertEqual(self.client.headers["Authorization"], "Bearer test_api_key")
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_resolve_library_id(self, mock_get):
         """Test resolving a library ID."""
         # Mock response
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "libraryId": "/vercel/next.js",
             "version": "latest",
             "description": "The React Framework for the Web"
-        }
+        }).encode("utf-8")
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
         
@@ -62,16 +65,64 @@ class TestContext7Client(unittest.TestCase):
             params={"libraryName": "next.js"}
         )
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
+    def test_response_cache(self, mock_get):
+        """Test that repeated requests are served from the cache."""
+        # Mock response
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({"libraryId": "/facebook/react"}).encode("utf-8")
+        mock_response.raise_for_status = MagicMock()
+        mock_get.return_value = mock_response
+        
+        # Only the first lookup reaches the server
+        first = self.client.resolve_library_id("react")
+        second = self.client.resolve_library_id("react")
+        self.assertEqual(first, second)
+        self.assertEqual(mock_get.call_count, 1)
+        
+        # Different arguments are cached separately
+        self.client.resolve_library_id("vue")
+        self.assertEqual(mock_get.call_count, 2)
+        
+        # Cache hits return independent copies
+        first["libraryId"] = "changed"
+        self.assertEqual(self.client.resolve_library_id("react")["libraryId"], "/facebook/react")
+        
+        # Clearing the cache fetches the response again
+        self.client.clear_cache()
+        self.client.resolve_library_id("react")
+        self.assertEqual(mock_get.call_count, 3)
+    
+    @patch('src.mcp.context7_client.time.monotonic')
+    @patch('requests.Session.get')
+    def test_response_cache_ttl(self, mock_get, mock_monotonic):
+        """Test that cached responses expire after the cache TTL."""
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({"libraryId": "/facebook/react"}).encode("utf-8")
+        mock_response.raise_for_status = MagicMock()
+        mock_get.return_value = mock_response
+        client = Context7Client(self.config, cache_ttl=60)
+        
+        mock_monotonic.return_value = 0
+        client.resolve_library_id("react")
+        mock_monotonic.return_value = 59
+        client.resolve_library_id("react")
+        self.assertEqual(mock_get.call_count, 1)
+        
+        mock_monotonic.return_value = 60
+        client.resolve_library_id("react")
+        self.assertEqual(mock_get.call_count, 2)
+    
+    @patch('requests.Session.get')
     def test_get_library_docs(self, mock_get):
         """Test getting library documentation."""
         # Mock response
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "libraryId": "/vercel/next.js",
             "documentation": "Next.js documentation content...",
             "codeSnippets": ["example code 1", "example code 2"]
-        }
+        }).encode("utf-8")
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
         
@@ -94,6 +145,19 @@ class TestContext7Client(unittest.TestCase):
             }
         )
     
+    def test_shared_session(self):
+        """Test that clients use the HTTP session they are given."""
+        session = requests.Session()
+        client = Context7Client(self.config, session=session)
+        self.assertIs(client.session, session)
+        
+        # MCP clients registered with the manager share its session
+        manager = MCPManager()
+        first = manager.register_client(self.config)
+        second = manager.register_client(MCPServerConfig(name="other", endpoint="https://example.com"))
+        self.assertIs(first.session, manager.session)
+        self.assertIs(second.session, manager.session)
+    
     def test_create_autogen_tools(self):
         """Test creating Autogen-compatible tools."""
         tools = self.client.create_autogen_tools()
@@ -4,6 +4,10 @@ Integration tests for the Autogen Agents Framework.
 
 import os
 import sys
+import json
+import asyncio
+import dataclasses
+import subprocess
 import unittest
 from unittest.mock import patch, MagicMock
 from pathlib import Path
@@ -13,8 +17,11 @@ import tempfile
 sys.path.append(str(Path(__file__).parent.parent))
 
 from src.framework import AgentFramework
+from src.agents.base_agent import BaseAgent
+from src.agents.group_chat import GroupChat
 from src.utils.memory_manager import MemoryManager
-from src.config.config_manager import AgentConfig, MCPServerConfig
+from src.config.config_manager import AgentConfig, Config, ConfigManager, MCPServerConfig
+from src.config.azure_openai import create_llm_config
 
 class TestFrameworkIntegration(unittest.TestCase):
     """Integration tests for the Autogen Agents Framework."""
@@ -33,9 +40,41 @@ class TestFrameworkIntegration(unittest.TestCase):
     
     def tearDown(self):
         """Tear down test fixtures."""
-        # Remove the temporary database file
+        # Close the database connection and remove the temporary database file
+        self.memory_manager.close()
         os.unlink(self.temp_db.name)
     
+    def test_framework_import_does_not_load_autogen(self):
+        """Test that importing the framework defers importing Autogen and the tool and MCP modules until used."""
+        result = subprocess.run(
+            [
+                sys.executable, "-c",
+                "import sys, src.framework; src.framework.AgentFramework(); "
+                "print(any(name in sys.modules for name in ('autogen', 'src.tools.basic_tools', 'src.mcp.mcp_client')))"
+            ],
+            cwd=str(Path(__file__).parent.parent),
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+    
+    def test_cli_help_does_not_load_framework(self):
+        """Test that the CLI only builds the chosen command's parser and defers the framework import."""
+        result = subprocess.run(
+            [
+                sys.executable, "-c",
+                "import sys, src.cli; sys.argv = ['cli', 'create-agent', '--help']\n"
+                "try:\n    src.cli.main()\nexcept SystemExit:\n    print('src.framework' in sys.modules)"
+            ],
+            cwd=str(Path(__file__).parent.parent),
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        self.assertIn("--system-message", result.stdout)
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "False")
+    
     @patch('autogen.ConversableAgent')
     def test_create_agent(self, mock_agent):
         """Test creating an agent."""
@@ -57,6 +96,114 @@ class TestFrameworkIntegration(unittest.TestCase):
         self.assertEqual(agent.description, "Test assistant agent")
         self.assertEqual(agent.system_message, "You are a test assistant.")
     
+    @patch('autogen.ConversableAgent')
+    def test_agent_function_map(self, mock_agent):
+        """Test that an agent's function map holds one callable tool per name."""
+        first = lambda: 1
+        second = lambda: 2
+        agent = BaseAgent(
+            name="ToolAgent",
+            description="Agent with tools",
+            system_message="You use tools.",
+            llm_config={},
+            tools=[
+                {"name": "lookup", "function": first},
+                {"name": "schema_only", "description": "No function"},
+                {"name": "lookup", "function": second}
+            ]
+        )
+        
+        # The Autogen agent is only created when first used
+        mock_agent.assert_not_called()
+        self.assertIs(agent.agent, agent.agent)
+        self.assertEqual(mock_agent.call_count, 1)
+        self.assertEqual(mock_agent.call_args.kwargs["function_map"], {"lookup": second})
+        
+        # Tools registered later are added to the map
+        agent.register_tool("extra", first, "Extra tool")
+        self.assertEqual(agent._function_map(), {"lookup": second, "extra": first})
+    
+    @patch('autogen.GroupChat')
+    @patch('autogen.ConversableAgent')
+    def test_group_chat_agent_lookup(self, mock_agent, mock_group_chat):
+        """Test looking up group chat participants by name."""
+        agents = [
+            BaseAgent(name=name, description=name, system_message=name, llm_config={})
+            for name in ("Researcher", "Coder")
+        ]
+        group_chat = GroupChat(agents=agents)
+        
+        self.assertIs(group_chat.get_agent_by_name("Coder"), agents[1])
+        self.assertIsNone(group_chat.get_agent_by_name("Planner"))
+        self.assertEqual(group_chat.agents, tuple(agents))
+    
+    @patch('autogen.GroupChat')
+    def test_group_chat_select_speaker(self, mock_group_chat):
+        """Test that round robin and random speaker selection don't go through Autogen."""
+        agents = []
+        for name in ("Researcher", "Coder", "Planner"):
+            agent = MagicMock()
+            agent.name = name
+            agents.append(agent)
+        
+        # Round robin cycles through the agents in order
+        group_chat = GroupChat(agents=agents, speaker_selection_method="round_robin")
+        self.assertIs(group_chat.select_speaker(), agents[0])
+        self.assertIs(group_chat.select_speaker(agents[0]), agents[1])
+        self.assertIs(group_chat.select_speaker(agents[2]), agents[0])
+        
+        # Random selection never repeats the last speaker when repeats are disallowed
+        group_chat = GroupChat(agents=agents, speaker_selection_method="random", allow_repeat_speaker=False)
+        for _ in range(10):
+            self.assertIsNot(group_chat.select_speaker(agents[1]), agents[1])
+        
+        mock_group_chat.return_value.select_speaker.assert_not_called()
+    
+    def test_from_config_cache(self):
+        """Test that from_config reuses agents only when caching is requested."""
+        config = AgentConfig(
+            name="CachedAgent",
+            description="Agent built from config",
+            system_message="You are cached.",
+            llm_config={}
+        )
+        other_config = dataclasses.replace(config)
+        
+        # Without caching every call creates a new agent
+        self.assertIsNot(BaseAgent.from_config(config), BaseAgent.from_config(config))
+        
+        # With caching the same config object yields the same agent
+        agent = BaseAgent.from_config(config, cache=True)
+        self.assertIs(BaseAgent.from_config(config, cache=True), agent)
+        self.assertIsNot(BaseAgent.from_config(other_config, cache=True), agent)
+    
+    @patch('autogen.ConversableAgent')
+    def test_create_agents_batch(self, mock_agent):
+        """Test creating several agents that share tools."""
+        tools = [{"name": "noop", "description": "Do nothing", "function": lambda: None, "parameters": {}}]
+        agents = self.framework.create_agents_batch(
+            [
+                {
+                    "agent_type": "assistant",
+                    "name": "FirstAgent",
+                    "description": "First agent",
+                    "system_message": "You are the first agent."
+                },
+                {
+                    "agent_type": "assistant",
+                    "name": "SecondAgent",
+                    "description": "Second agent",
+                    "system_message": "You are the second agent."
+                }
+            ],
+            shared_tools=tools
+        )
+        
+        # Agents are created in order and registered with the framework
+        self.assertEqual([agent.name for agent in agents], ["FirstAgent", "SecondAgent"])
+        self.assertIs(self.framework.get_agent("SecondAgent"), agents[1])
+        self.assertEqual([tool["name"] for tool in agents[0].tools], ["noop"])
+    
     @patch('autogen.ConversableAgent')
     def test_create_specialized_agent(self, mock_agent):
         """Test creating a specialized agent."""
@@ -112,6 +259,155 @@ class TestFrameworkIntegration(unittest.TestCase):
         self.assertEqual(tool.description, "Add two numbers together")
         self.assertEqual(tool.function, add_numbers)
     
+    def test_register_tools(self):
+        """Test registering several tools at once."""
+        # Register two tools in one call
+        self.framework.register_tools([
+            {"name": "add_numbers", "description": "Add two numbers", "function": lambda a, b: a + b},
+            {
+                "name": "negate",
+                "description": "Negate a number",
+                "function": lambda a: -a,
+                "parameters": {"a": {"type": "number", "description": "Number"}}
+            }
+        ])
+        
+        # Verify both tools were registered and the tool dicts include them
+        self.assertEqual(self.framework.tool_registry.get_tool("add_numbers").parameters, {})
+        self.assertIn("a", self.framework.tool_registry.get_tool("negate").parameters)
+        names = [tool["name"] for tool in self.framework.tool_registry.get_tool_dicts()]
+        self.assertIn("add_numbers", names)
+        self.assertIn("negate", names)
+    
+    def test_tool_dicts_cache(self):
+        """Test that cached tool dictionaries are refreshed on registration."""
+        tool_dicts = self.framework.tool_registry.get_tool_dicts()
+        
+        # Repeated calls reuse the same object
+        self.assertIs(self.framework.tool_registry.get_tool_dicts(), tool_dicts)
+        
+        # Registering a tool invalidates the cache
+        self.framework.register_tool(
+            name="noop",
+            description="Do nothing",
+            function=lambda: None
+        )
+        updated_dicts = self.framework.tool_registry.get_tool_dicts()
+        self.assertEqual(len(updated_dicts), len(tool_dicts) + 1)
+        self.assertIn("noop", [tool["name"] for tool in updated_dicts])
+    
+    def test_basic_tools_per_framework(self):
+        """Test that every framework starts with the basic tools in its own registry."""
+        other = AgentFramework()
+        other.register_tool(name="noop", description="Do nothing", function=lambda: None)
+        
+        names = [tool["name"] for tool in self.framework.tool_registry.get_tool_dicts()]
+        self.assertIn("web_search", names)
+        self.assertNotIn("noop", names)
+        self.assertEqual(len(other.tool_registry.tools), len(names) + 1)
+    
+    def test_create_llm_config_cache(self):
+        """Test that cached LLM configurations are returned as independent copies."""
+        azure_config = self.framework.config_manager.get_azure_openai_config()
+        
+        first = create_llm_config(azure_config, temperature=0.9, max_tokens=2000)
+        first["config_list"][0]["max_tokens"] = 1
+        first["functions"] = {}
+        
+        # Mutating one result doesn't leak into later calls
+        second = create_llm_config(azure_config, temperature=0.9, max_tokens=2000)
+        self.assertEqual(second["temperature"], 0.9)
+        self.assertEqual(second["config_list"][0]["max_tokens"], 2000)
+        self.assertNotIn("functions", second)
+    
+    def test_config_file_reload(self):
+        """Test that a configuration file is re-read after it changes."""
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            json.dump({"azure_openai": {"api_key": "key", "endpoint": "https://one.example.com", "deployment_name": "gpt"}}, f)
+        self.addCleanup(os.unlink, f.name)
+        
+        self.assertEqual(ConfigManager(f.name).get_azure_openai_config().endpoint, "https://one.example.com")
+        
+        with open(f.name, "w") as rewritten:
+            json.dump({"azure_openai": {"api_key": "key", "endpoint": "https://two.example.com", "deployment_name": "gpt"}}, rewritten)
+        self.assertEqual(ConfigManager(f.name).get_azure_openai_config().endpoint, "https://two.example.com")
+    
+    def test_save_config(self):
+        """Test that a saved configuration loads back unchanged."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        config_path = os.path.join(temp_dir.name, "config.json")
+        
+        self.framework.save_config(config_path)
+        self.assertEqual(ConfigManager(config_path).config, self.framework.config_manager.config)
+        
+        # Changes made in place are reflected in the next save
+        self.framework.config_manager.config.mcp_servers["docs"] = MCPServerConfig(name="docs", endpoint="https://docs.example.com")
+        updated_path = os.path.join(temp_dir.name, "updated.json")
+        self.framework.save_config(updated_path)
+        self.assertIn("docs", ConfigManager(updated_path).config.mcp_servers)
+    
+    def test_config_from_dict_validation(self):
+        """Test that config files ignore unknown keys and report missing or mistyped fields."""
+        azure = {"api_key": "key", "endpoint": "https://example.com", "deployment_name": "gpt"}
+        agent = {"name": "Helper", "description": "Helps", "system_message": "Help.", "llm_config": {}, "type": "assistant"}
+        
+        config = Config._from_dict({"azure_openai": azure, "agents": {"Helper": agent}})
+        self.assertEqual(config.agents["Helper"].name, "Helper")
+        
+        with self.assertRaisesRegex(ValueError, "azure_openai"):
+            Config._from_dict({})
+        with self.assertRaisesRegex(ValueError, "agents.Helper.llm_config"):
+            Config._from_dict({"azure_openai": azure, "agents": {"Helper": {**agent, "llm_config": None}}})
+        with self.assertRaisesRegex(ValueError, "mcp_servers.docs.endpoint"):
+            Config._from_dict({"azure_openai": azure, "mcp_servers": {"docs": {"name": "docs"}}})
+    
+    def test_env_config_reload(self):
+        """Test that the environment configuration follows changes to the variables."""
+        self.assertEqual(ConfigManager().get_azure_openai_config().deployment_name, os.environ["AZURE_OPENAI_DEPLOYMENT_NAME"])
+        
+        with patch.dict(os.environ, {"AZURE_OPENAI_DEPLOYMENT_NAME": "other-deployment"}):
+            self.assertEqual(ConfigManager().get_azure_openai_config().deployment_name, "other-deployment")
+    
+    def test_start_conversation_returns_reply(self):
+        """Test that starting a conversation returns the receiver's last reply."""
+        sender = MagicMock()
+        receiver = MagicMock()
+        receiver.agent.chat_messages = {
+            sender.agent: [
+                {"role": "user", "content": "Hello"},
+                {"role": "assistant", "content": "Here is the plan"},
+                {"role": "user", "content": "TERMINATE"}
+            ]
+        }
+        
+        reply = self.framework.start_conversation(sender, receiver, "Hello")
+        
+        sender.initiate_chat.assert_called_once_with(receiver, "Hello")
+        self.assertEqual(reply["content"], "Here is the plan")
+    
+    def test_start_conversation_unknown_agent(self):
+        """Test that starting a conversation with an unknown agent name names that agent."""
+        with self.assertRaisesRegex(ValueError, "Agent not found: Nobody"):
+            self.framework.start_conversation("Nobody", MagicMock(), "Hello")
+    
+    def test_initiate_chat_async(self):
+        """Test running several conversations with distinct agents concurrently."""
+        self.framework.start_conversation = MagicMock()
+        
+        async def run_chats():
+            await asyncio.gather(
+                self.framework.initiate_chat_async("ResearchCoordinator", "Researcher", "research"),
+                self.framework.initiate_chat_async("CodeCoordinator", "Coder", "code"),
+            )
+        
+        asyncio.run(run_chats())
+        
+        # Both conversations were started
+        self.assertEqual(self.framework.start_conversation.call_count, 2)
+        self.framework.start_conversation.assert_any_call("ResearchCoordinator", "Researcher", "research")
+        self.framework.start_conversation.assert_any_call("CodeCoordinator", "Coder", "code")
+    
     @patch('src.mcp.mcp_client.MCPClient')
     def test_register_mcp_server(self, mock_mcp_client):
         """Test registering an MCP server."""
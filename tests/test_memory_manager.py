@@ -4,14 +4,16 @@ Unit tests for the memory manager.
 
 import os
 import sys
+import sqlite3
 import unittest
 import tempfile
+from unittest.mock import patch, MagicMock
 from pathlib import Path
 
 # Add the parent directory to the Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from src.utils.memory_manager import MemoryManager
+from src.utils.memory_manager import MemoryManager, new_conversation_id
 
 class TestMemoryManager(unittest.TestCase):
     """Test cases for the memory manager."""
@@ -25,7 +27,8 @@ class TestMemoryManager(unittest.TestCase):
     
     def tearDown(self):
         """Tear down test fixtures."""
-        # Remove the temporary database file
+        # Close the database connection and remove the temporary database file
+        self.memory_manager.close()
         os.unlink(self.temp_db.name)
     
     def test_create_conversation(self):
@@ -40,6 +43,13 @@ class TestMemoryManager(unittest.TestCase):
         self.assertEqual(conversations[0]["conversation_id"], "test-conversation")
         self.assertEqual(conversations[0]["title"], "Test Conversation")
     
+    def test_new_conversation_id(self):
+        """Test generating conversation IDs."""
+        first = new_conversation_id()
+        self.assertEqual(len(first), 32)
+        int(first, 16)
+        self.assertNotEqual(first, new_conversation_id())
+    
     def test_add_message(self):
         """Test adding a message to a conversation."""
         # Add a message to a new conversation
@@ -58,6 +68,156 @@ class TestMemoryManager(unittest.TestCase):
         self.assertEqual(history[0]["receiver"], "receiver")
         self.assertEqual(history[0]["content"], "Hello, world!")
     
+    def test_add_messages_bulk(self):
+        """Test adding several messages in one transaction."""
+        result = self.memory_manager.add_messages_bulk(
+            "test-conversation",
+            [
+                ("User", "Assistant", "Hello"),
+                ("Assistant", "User", "Hi there"),
+                ("User", "Assistant", "Bye")
+            ]
+        )
+        self.assertTrue(result)
+        
+        # Messages come back in insertion order
+        history = self.memory_manager.get_conversation_history("test-conversation")
+        self.assertEqual([m["content"] for m in history], ["Hello", "Hi there", "Bye"])
+        
+        # The conversation is created on demand
+        conversations = self.memory_manager.get_recent_conversations()
+        self.assertEqual(len(conversations), 1)
+    
+    def test_tuning_pragmas(self):
+        """Test that the performance PRAGMAs are applied only when tuning is enabled."""
+        conn = self.memory_manager._conn
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertEqual(conn.execute("PRAGMA cache_size").fetchone()[0], -20000)
+        self.assertEqual(conn.execute("PRAGMA foreign_keys").fetchone()[0], 1)
+        
+        # Open a second manager without tuning on a fresh database
+        plain_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        plain_db.close()
+        plain_manager = MemoryManager(db_path=plain_db.name, tuning=False)
+        try:
+            conn = plain_manager._conn
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "delete")
+            self.assertEqual(conn.execute("PRAGMA foreign_keys").fetchone()[0], 0)
+        finally:
+            plain_manager.close()
+            os.unlink(plain_db.name)
+    
+    def test_query_indexes(self):
+        """Test that memory and history lookups use an index instead of a table scan."""
+        conn = self.memory_manager._conn
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM memories WHERE agent_name = ? AND memory_type = ?",
+            ("test-agent", "fact")
+        ).fetchall()
+        self.assertIn("idx_mem_agent_type", plan[0][3])
+        
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM messages WHERE conversation_id = ? ORDER BY timestamp, id",
+            ("test-conversation",)
+        ).fetchall()
+        self.assertEqual(len(plan), 1)
+        self.assertIn("idx_msg_conv_ts", plan[0][3])
+    
+    def test_transaction(self):
+        """Test grouping several calls into one transaction."""
+        with self.memory_manager.transaction():
+            self.assertTrue(self.memory_manager.create_conversation("test-conversation", "Test"))
+            self.assertTrue(self.memory_manager.store_memory("test-agent", "fact", "Grouped"))
+            self.assertTrue(self.memory_manager.add_message("test-conversation", "User", "Assistant", "Hello"))
+            
+            # A failing call only undoes its own changes
+            self.assertFalse(self.memory_manager.create_conversation("test-conversation", "Duplicate"))
+        
+        self.assertEqual(len(self.memory_manager.get_conversation_history("test-conversation")), 1)
+        self.assertEqual(len(self.memory_manager.retrieve_memories("test-agent")), 1)
+        
+        # Raising inside the block rolls back everything in it
+        with self.assertRaises(RuntimeError):
+            with self.memory_manager.transaction():
+                self.memory_manager.store_memory("test-agent", "fact", "Discarded")
+                raise RuntimeError("abort")
+        self.assertEqual(len(self.memory_manager.retrieve_memories("test-agent")), 1)
+    
+    def test_background_writer(self):
+        """Test queueing messages for the background writer."""
+        self.memory_manager.start_writer()
+        
+        for i in range(5):
+            result = self.memory_manager.add_message("test-conversation", "User", "Assistant", f"Message {i}")
+            self.assertTrue(result)
+        self.memory_manager.add_message("other-conversation", "User", "Assistant", "Elsewhere")
+        
+        # Flushing makes every queued message visible
+        self.memory_manager.flush()
+        history = self.memory_manager.get_conversation_history("test-conversation")
+        self.assertEqual([m["content"] for m in history], [f"Message {i}" for i in range(5)])
+        self.assertEqual(len(self.memory_manager.get_recent_conversations()), 2)
+    
+    def test_background_writer_in_transaction(self):
+        """Test that messages added inside a transaction bypass the background writer."""
+        self.memory_manager.start_writer()
+        
+        # The message is committed with the block instead of being queued
+        with self.memory_manager.transaction():
+            self.memory_manager.add_message("test-conversation", "User", "Assistant", "Grouped")
+            with self.assertRaises(RuntimeError):
+                self.memory_manager.flush()
+        self.assertEqual(len(self.memory_manager.get_conversation_history("test-conversation")), 1)
+        
+        # A rolled back block discards its messages
+        with self.assertRaises(RuntimeError):
+            with self.memory_manager.transaction():
+                self.memory_manager.add_message("test-conversation", "User", "Assistant", "Discarded")
+                raise RuntimeError("abort")
+        self.memory_manager.flush()
+        self.assertEqual(len(self.memory_manager.get_conversation_history("test-conversation")), 1)
+    
+    def test_get_conversation_history_summary(self):
+        """Test retrieving conversation history with truncated content."""
+        self.memory_manager.add_message("test-conversation", "sender", "receiver", "x" * 250)
+        
+        summary = self.memory_manager.get_conversation_history_summary("test-conversation", content_chars=100)
+        self.assertEqual(len(summary), 1)
+        self.assertEqual(summary[0]["sender"], "sender")
+        self.assertEqual(summary[0]["content"], "x" * 100)
+    
+    def test_iter_conversation_history(self):
+        """Test streaming conversation history in batches."""
+        self.memory_manager.add_messages_bulk(
+            "test-conversation",
+            [("User", "Assistant", f"Message {i} " + "x" * 50) for i in range(5)]
+        )
+        
+        history = list(self.memory_manager.iter_conversation_history("test-conversation", content_chars=9, batch_size=2))
+        self.assertEqual([m["content"] for m in history], [f"Message {i}" for i in range(5)])
+    
+    def test_iter_conversation_history_closes_cursor(self):
+        """Test that stopping a history stream early closes its cursor."""
+        self.memory_manager.add_messages_bulk(
+            "test-conversation",
+            [("User", "Assistant", f"Message {i}") for i in range(5)]
+        )
+        
+        cursors = []
+        connection = self.memory_manager._conn
+        
+        def execute(*args):
+            cursor = connection.execute(*args)
+            cursors.append(cursor)
+            return cursor
+        
+        with patch.object(self.memory_manager, "_conn", MagicMock(execute=execute)):
+            history = self.memory_manager.iter_conversation_history("test-conversation", batch_size=2)
+            next(history)
+            history.close()
+        with self.assertRaises(sqlite3.ProgrammingError):
+            cursors[0].fetchone()
+    
     def test_store_and_retrieve_memory(self):
         """Test storing and retrieving memories."""
         # Store a string memory
@@ -90,6 +250,76 @@ class TestMemoryManager(unittest.TestCase):
         self.assertEqual(preference_memories[0]["content"]["color"], "blue")
         self.assertEqual(preference_memories[0]["content"]["food"], "pizza")
     
+    def test_store_memories_bulk(self):
+        """Test storing several memories in one transaction."""
+        result = self.memory_manager.store_memories_bulk([
+            ("agent-a", "skill", {"skill_name": "research"}),
+            ("agent-b", "fact", "Water is wet")
+        ])
+        self.assertTrue(result)
+        
+        # Dictionary content round-trips through JSON
+        memories = self.memory_manager.retrieve_memories("agent-a")
+        self.assertEqual(len(memories), 1)
+        self.assertEqual(memories[0]["content"]["skill_name"], "research")
+        
+        memories = self.memory_manager.retrieve_memories("agent-b", "fact")
+        self.assertEqual(memories[0]["content"], "Water is wet")
+    
+    def test_memory_content_deduplication(self):
+        """Test that identical memory content is stored once."""
+        self.memory_manager.store_memory("agent-a", "skill", {"proficiency": "expert", "name": "a"})
+        self.memory_manager.store_memory("agent-b", "skill", {"name": "a", "proficiency": "expert"})
+        
+        # Both memories read back, but share one stored content row
+        self.assertEqual(self.memory_manager.retrieve_memories("agent-a")[0]["content"]["name"], "a")
+        self.assertEqual(self.memory_manager.retrieve_memories("agent-b")[0]["content"]["proficiency"], "expert")
+        count = self.memory_manager._conn.execute("SELECT COUNT(*) FROM memory_contents").fetchone()[0]
+        self.assertEqual(count, 1)
+    
+    def test_memory_content_cleanup(self):
+        """Test that stored content is removed once no memory references it."""
+        def content_count():
+            return self.memory_manager._conn.execute("SELECT COUNT(*) FROM memory_contents").fetchone()[0]
+        
+        self.memory_manager.store_memory("agent-a", "fact", "The sky is blue")
+        self.memory_manager.store_memory("agent-b", "fact", "The sky is blue")
+        first_id = self.memory_manager.retrieve_memories("agent-a")[0]["id"]
+        second_id = self.memory_manager.retrieve_memories("agent-b")[0]["id"]
+        
+        # Shared content stays while another memory still uses it
+        self.memory_manager.update_memory(first_id, "The sky is gray")
+        self.assertEqual(content_count(), 2)
+        
+        # Replaced and deleted content is removed
+        self.memory_manager.update_memory(second_id, "The sky is gray")
+        self.assertEqual(content_count(), 1)
+        self.memory_manager.delete_memory(first_id)
+        self.assertEqual(content_count(), 1)
+        self.memory_manager.delete_memory(second_id)
+        self.assertEqual(content_count(), 0)
+    
+    def test_retrieve_memories_multi(self):
+        """Test retrieving memories for several agents at once."""
+        self.memory_manager.store_memory("agent-a", "fact", "First")
+        self.memory_manager.store_memory("agent-b", "skill", {"skill_name": "coding"})
+        self.memory_manager.store_memory("agent-a", "fact", "Second")
+        
+        memories_by_agent = self.memory_manager.retrieve_memories_multi(["agent-a", "agent-b", "agent-c"])
+        self.assertEqual(list(memories_by_agent), ["agent-a", "agent-b", "agent-c"])
+        self.assertEqual([m["content"] for m in memories_by_agent["agent-a"]], ["First", "Second"])
+        self.assertEqual(memories_by_agent["agent-b"][0]["content"]["skill_name"], "coding")
+        self.assertEqual(memories_by_agent["agent-c"], [])
+    
+    def test_memory_content_types(self):
+        """Test that string content is returned as stored and dictionary content is parsed."""
+        self.memory_manager.store_memory("test-agent", "fact", "42")
+        self.memory_manager.store_memory("test-agent", "fact", "{not json")
+        self.memory_manager.store_memory("test-agent", "preference", {"color": "blue"})
+        
+        contents = [memory["content"] for memory in self.memory_manager.retrieve_memories("test-agent")]
+        self.assertEqual(contents, ["42", "{not json", {"color": "blue"}])
+    
     def test_update_memory(self):
         """Test updating a memory."""
         # Store a memory
@@ -159,6 +389,25 @@ class TestMemoryManager(unittest.TestCase):
         results = self.memory_manager.search_memories("green")
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0]["content"], "The grass is green")
+    
+    def test_search_index_stays_in_sync(self):
+        """Test that searches reflect updated and deleted memories."""
+        self.memory_manager.store_memory("test-agent", "fact", "The sky is blue")
+        self.memory_manager.store_memory("test-agent", "fact", "The grass is green")
+        memory_id = self.memory_manager.retrieve_memories("test-agent")[0]["id"]
+        
+        # Substrings and short queries still match
+        self.assertEqual(len(self.memory_manager.search_memories("rass")), 1)
+        self.assertEqual(len(self.memory_manager.search_memories("ky")), 1)
+        
+        # Updated content replaces the old content in the index
+        self.memory_manager.update_memory(memory_id, "The sky is grey")
+        self.assertEqual(self.memory_manager.search_memories("blue"), [])
+        self.assertEqual(len(self.memory_manager.search_memories("grey")), 1)
+        
+        # Deleted memories are no longer found
+        self.memory_manager.delete_memory(memory_id)
+        self.assertEqual(self.memory_manager.search_memories("grey"), [])
 
 if __name__ == "__main__":
     unittest.main()